@@ -72,6 +72,10 @@ def summarize(name, samples_s):
         "p99_ms": 1000.0 * pct(xs, 0.99),
     }
 
+def ns_to_s(samples_ns):
+    """Convert perf_counter_ns() deltas to seconds once, outside the timed loop."""
+    return [ns / 1e9 for ns in samples_ns]
+
 def env_info():
     return {
         "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -95,25 +99,26 @@ def warm_up(shell, n=6, cmd=NOOP):
 def benchmark_single_commands(shell, num_commands=100, cmd_template=None, progress_every=0):
     """Sequential runs of one command at a time; returns summary/times/results_count."""
     cmd_template = cmd_template or SLEEP_1MS  # default matches prior behavior
-    times, failures = [], 0
-    start_total = time.perf_counter()
+    times_ns, failures = [], 0
+    start_total = time.perf_counter_ns()
 
     for i in range(num_commands):
         cmd = cmd_template.format(i=i) if "{i}" in cmd_template else cmd_template
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         try:
             shell.run(cmd)
         except Exception:
             failures += 1
             raise
         finally:
-            t1 = time.perf_counter()
-            times.append(t1 - t0)
+            t1 = time.perf_counter_ns()
+            times_ns.append(t1 - t0)
 
         if progress_every and i and (i % progress_every == 0):
             print(f"  sequential: {i}/{num_commands}")
 
-    total_time = time.perf_counter() - start_total
+    total_time = (time.perf_counter_ns() - start_total) / 1e9
+    times = ns_to_s(times_ns)
     summ = summarize("single_sequential", times)
     summ.update({
         "total_s": total_time,
@@ -215,19 +220,20 @@ def benchmark_command_types(shell, num_commands=20, progress_every=0):
         "file_operation": 'Get-ChildItem | Select-Object -First 1',
         "variable_assignment": '$x = 5; $x * 2',
     }
-    raw_times = {k: [] for k in kinds}
-    t0 = time.perf_counter()
+    raw_ns = {k: [] for k in kinds}
+    t0 = time.perf_counter_ns()
 
     for i in range(num_commands):
         for kind, cmd in kinds.items():
-            s = time.perf_counter()
+            s = time.perf_counter_ns()
             shell.run(cmd)
-            e = time.perf_counter()
-            raw_times[kind].append(e - s)
+            e = time.perf_counter_ns()
+            raw_ns[kind].append(e - s)
         if progress_every and i and (i % progress_every == 0):
             print(f"  types: {i}/{num_commands}")
 
-    total_wall = time.perf_counter() - t0
+    total_wall = (time.perf_counter_ns() - t0) / 1e9
+    raw_times = {k: ns_to_s(v) for k, v in raw_ns.items()}
     summaries = {}
     for kind, samples in raw_times.items():
         s = summarize(kind, samples)
@@ -274,13 +280,13 @@ def analyze_performance_characteristics():
         sh.run('Write-Output "warmup"')
 
         # Overhead of an "empty-ish" command
-        overhead_times = []
+        overhead_ns = []
         for _ in range(24):
-            a = time.perf_counter()
+            a = time.perf_counter_ns()
             sh.run(NOOP)
-            b = time.perf_counter()
-            overhead_times.append(b - a)
-        overhead_mean = statistics.fmean(overhead_times)
+            b = time.perf_counter_ns()
+            overhead_ns.append(b - a)
+        overhead_mean = statistics.fmean(ns_to_s(overhead_ns))
 
         # Output size impact
         sizes = [10, 100, 1000, 10_000]
@@ -377,33 +383,34 @@ def run_all(cfg):
                 batch_eff = (single_mean_s / batch_per_cmd_mean) if batch_per_cmd_mean > 0 else 0.0
                 async_eff = ((single_mean_s * async_n) / async_summ["wall_time_s"]) if async_summ["wall_time_s"] > 0 else 0.0
 
-                # Print compact result
-                print("\n--- RESULTS ---")
-                print(f"Single (sequential): total={single_summ['total_s']:.3f}s | "
+                # Print compact result in one write, after all timing for this size is done
+                lines = ["\n--- RESULTS ---"]
+                lines.append(f"Single (sequential): total={single_summ['total_s']:.3f}s | "
                     f"mean={single_summ['mean_ms']:.1f} ms | p50={single_summ['p50_ms']:.1f} | "
                     f"p95={single_summ['p95_ms']:.1f} | p99={single_summ['p99_ms']:.1f} | "
                     f"thr={single_summ['throughput_cmds_per_s']:.1f} cmd/s")
 
-                print(f"Batch (repeats={cfg.batch_repeats}): mean wall/batch={batch_summ['per_batch_mean_s']:.3f}s | "
+                lines.append(f"Batch (repeats={cfg.batch_repeats}): mean wall/batch={batch_summ['per_batch_mean_s']:.3f}s | "
                     f"total(all)={batch_summ['total_wall_s']:.3f}s | p50={batch_summ['p50_ms']:.1f} | "
                     f"p95={batch_summ['p95_ms']:.1f} | p99={batch_summ['p99_ms']:.1f} | "
                     f"thr={batch_summ['throughput_cmds_per_s']:.1f} cmd/s")
 
-                print(f"Async (single-shell queue, n={async_n}): wall={async_summ['wall_time_s']:.3f}s | "
+                lines.append(f"Async (single-shell queue, n={async_n}): wall={async_summ['wall_time_s']:.3f}s | "
                     f"lat mean={async_summ['mean_ms']:.1f} ms | p50={async_summ['p50_ms']:.1f} | "
                     f"p95={async_summ['p95_ms']:.1f} | p99={async_summ['p99_ms']:.1f} | "
                     f"thr={async_summ['throughput_cmds_per_s']:.1f} cmd/s")
 
                 if type_summaries:
-                    print("\nCommand type summaries (ms):")
+                    lines.append("\nCommand type summaries (ms):")
                     for k, s in type_summaries.items():
                         if k == "_total": continue
-                        print(f"  {k:18s} mean={s['mean_ms']:.1f} | p50={s['p50_ms']:.1f} | "
+                        lines.append(f"  {k:18s} mean={s['mean_ms']:.1f} | p50={s['p50_ms']:.1f} | "
                             f"p95={s['p95_ms']:.1f} | p99={s['p99_ms']:.1f}")
 
-                print("\nEfficiencies:")
-                print(f"  batch_efficiency: {batch_eff:.2f}x (vs single mean per cmd)")
-                print(f"  async_efficiency: {async_eff:.2f}x (vs single mean × n / async wall)")
+                lines.append("\nEfficiencies:")
+                lines.append(f"  batch_efficiency: {batch_eff:.2f}x (vs single mean per cmd)")
+                lines.append(f"  async_efficiency: {async_eff:.2f}x (vs single mean × n / async wall)")
+                sys.stdout.write("\n".join(lines) + "\n")
 
                 report["per_size"][size] = {
                     "single": single_summ,
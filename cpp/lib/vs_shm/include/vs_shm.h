@@ -5,6 +5,12 @@
 // 2. All transfers use chunking (consistent, predictable)
 // 3. Zero-copy via offset-based shared memory access
 // 4. PowerShell serializes objects to bytes via C++/CLI
+// 5. Each chunk is copied to the start of its direction's region and is
+//    at most frame_bytes long, so a chunk is always one contiguous range
+//    [chunk_offset, chunk_offset + chunk_length) - there is no wrap-around
+// 6. Both data regions start on a VS_REGION_ALIGN boundary: the header is
+//    padded up to it and each region spans whole pages, so chunk copies start
+//    page-aligned and never share a page with the header
 
 #pragma once
 #include <stdint.h>
@@ -21,11 +27,20 @@
 // =============================================================================
 
 static const uint32_t VS_MAGIC = 0x5653484D;  // 'VSHM'
-static const uint32_t VS_VERSION = 2;
+static const uint32_t VS_VERSION = 3;
 
 static const uint32_t VS_DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024;  // 4 MB
 static const uint32_t VS_DEFAULT_FRAME_SIZE = 64 * 1024 * 1024; // 64 MB
 
+// Alignment of the py2ps/ps2py data regions within the mapping
+static const uint64_t VS_REGION_ALIGN = 4096;
+
+// VS_CreateChannelEx flags
+static const uint32_t VS_CHANNEL_LARGE_PAGES = 0x1;  // Back the section with large pages if allowed
+
+// VS_SendPy2PsAll out_chunk_index when the error was not tied to a chunk
+static const uint32_t VS_NO_CHUNK = UINT32_MAX;
+
 // =============================================================================
 // STATUS CODES
 // =============================================================================
@@ -46,7 +61,7 @@ enum VS_Status : int32_t {
 
 struct VS_Header {
     uint32_t magic;            // 'VSHM' marker
-    uint32_t version;          // Protocol version (2)
+    uint32_t version;          // Protocol version (3)
     uint64_t frame_bytes;      // Size of data region per direction
     
     // Python → PowerShell transfer state (48 bytes)
@@ -79,6 +94,27 @@ struct VS_Header {
 // Total: 4+4+8 + 48 + 48 + 80 = 192 bytes
 static_assert(sizeof(VS_Header) == 192, "VS_Header must be 192 bytes");
 
+// Each direction's state owns its own 64-byte cache line (py2ps shares line 0
+// only with the read-only magic/version/frame_bytes), so traffic in one
+// direction never bounces the other direction's line between cores. Python
+// and PowerShell also read these offsets directly from shared memory.
+static_assert(offsetof(VS_Header, py2ps) == 16, "py2ps state must start at offset 16");
+static_assert(offsetof(VS_Header, ps2py) == 64, "ps2py state must start on its own cache line");
+
+// =============================================================================
+// CHUNK INFO
+// =============================================================================
+
+// Chunk metadata filled in by VS_WaitPs2PyChunkInfo - one out-param instead of three
+struct VS_ChunkInfo {
+    uint32_t chunk_index;      // Chunk index (0-based)
+    uint32_t reserved;         // Padding, always 0
+    uint64_t offset;           // Offset of the chunk from the memory base
+    uint64_t length;           // Length of the chunk in bytes
+};
+
+static_assert(sizeof(VS_ChunkInfo) == 24, "VS_ChunkInfo must be 24 bytes");
+
 // =============================================================================
 // CHANNEL HANDLE
 // =============================================================================
@@ -97,6 +133,24 @@ VS_API VS_Channel VS_CreateChannel(
     uint64_t frame_bytes
 );
 
+// Create channel with VS_CHANNEL_* flags
+// VS_CHANNEL_LARGE_PAGES: try a large-page section (SeLockMemoryPrivilege must be
+// granted; it is enabled in the token on first use), falling back to regular
+// pages - VS_GetChannelFlags reports which one was used
+VS_API VS_Channel VS_CreateChannelEx(
+    const wchar_t* name,
+    uint64_t frame_bytes,
+    uint32_t flags
+);
+
+// VS_CHANNEL_* flags actually in effect for this handle (a large-page request
+// that fell back to regular pages reports 0)
+VS_API uint32_t VS_GetChannelFlags(VS_Channel ch);
+
+// Enable SeLockMemoryPrivilege in the process token (once per process)
+// Returns 1 if enabled, 0 if the privilege is not granted to the account
+VS_API int32_t VS_EnableLockMemoryPrivilege();
+
 // Close channel - Python calls this when done
 VS_API void VS_DestroyChannel(VS_Channel ch);
 
@@ -133,6 +187,19 @@ VS_API int32_t VS_WaitPy2PsAck(
 // Mark transfer complete (Python side)
 VS_API int32_t VS_FinishPy2PsTransfer(VS_Channel ch);
 
+// Send a whole buffer (Python side): Begin, then Send + WaitAck per chunk,
+// then Finish, all inside the DLL
+// out_chunk_index (optional): chunk that was being sent when an error occurred,
+// or VS_NO_CHUNK if Begin or Finish failed
+VS_API int32_t VS_SendPy2PsAll(
+    VS_Channel ch,
+    const uint8_t* data,
+    uint64_t total_size,
+    uint64_t chunk_size,
+    uint32_t timeout_ms,
+    uint32_t* out_chunk_index
+);
+
 // =============================================================================
 // POWERSHELL → PYTHON TRANSFER
 // =============================================================================
@@ -176,9 +243,24 @@ VS_API int32_t VS_WaitPs2PyChunk(
     uint32_t timeout_ms
 );
 
+// Same as VS_WaitPs2PyChunk, but fills a single VS_ChunkInfo
+VS_API int32_t VS_WaitPs2PyChunkInfo(
+    VS_Channel ch,
+    VS_ChunkInfo* out_info,
+    uint32_t timeout_ms
+);
+
 // Acknowledge chunk received (Python side)
 VS_API int32_t VS_AckPs2PyChunk(VS_Channel ch);
 
+// Acknowledge the current chunk and wait for the next one in a single call
+// (VS_AckPs2PyChunk followed by VS_WaitPs2PyChunkInfo)
+VS_API int32_t VS_AckWaitPs2PyChunkInfo(
+    VS_Channel ch,
+    VS_ChunkInfo* out_info,
+    uint32_t timeout_ms
+);
+
 // Check if transfer is complete
 VS_API int32_t VS_IsPs2PyComplete(VS_Channel ch);
 
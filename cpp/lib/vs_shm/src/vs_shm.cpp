@@ -10,6 +10,11 @@
 #include <memory>
 #include "../include/vs_shm.h"
 
+#if defined(_M_X64) || defined(_M_IX86) || defined(__x86_64__) || defined(__i386__)
+#include <emmintrin.h>
+#define VS_HAVE_SSE2 1
+#endif
+
 // =============================================================================
 // INTERNAL HELPERS
 // =============================================================================
@@ -30,6 +35,64 @@ static inline void atomic_store_u64(volatile LONG64* ptr, uint64_t value) {
     InterlockedExchange64(ptr, static_cast<LONG64>(value));
 }
 
+static inline uint64_t align_up(uint64_t value, uint64_t alignment) {
+    return (value + alignment - 1) / alignment * alignment;
+}
+
+// SEC_LARGE_PAGES / MEM_LARGE_PAGES need SeLockMemoryPrivilege *enabled* in the
+// process token. Granting it (secpol "Lock pages in memory") is not enough -
+// it is disabled by default, so enable it here.
+static bool enable_lock_memory_privilege() {
+    HANDLE token = nullptr;
+    if (!OpenProcessToken(GetCurrentProcess(), TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY, &token)) {
+        return false;
+    }
+    
+    TOKEN_PRIVILEGES tp = {};
+    tp.PrivilegeCount = 1;
+    tp.Privileges[0].Attributes = SE_PRIVILEGE_ENABLED;
+    bool enabled = false;
+    if (LookupPrivilegeValueW(nullptr, SE_LOCK_MEMORY_NAME, &tp.Privileges[0].Luid)) {
+        // Succeeds even when the privilege is not granted - check the last error
+        enabled = AdjustTokenPrivileges(token, FALSE, &tp, 0, nullptr, nullptr)
+            && GetLastError() != ERROR_NOT_ALL_ASSIGNED;
+    }
+    CloseHandle(token);
+    return enabled;
+}
+
+// Chunks of at least this size are copied with non-temporal stores. Tied to
+// the default chunk size so default-configured bulk transfers take the
+// streaming path; smaller chunks (small payloads or a tuned-down chunk_mb)
+// use regular stores so the reader can hit in the shared last-level cache.
+static const size_t VS_STREAM_COPY_THRESHOLD = VS_DEFAULT_CHUNK_SIZE;
+
+static void copy_chunk(uint8_t* dst, const uint8_t* src, size_t length) {
+#if VS_HAVE_SSE2
+    if (length >= VS_STREAM_COPY_THRESHOLD && (reinterpret_cast<uintptr_t>(dst) & 15) == 0) {
+        size_t blocks = length / 64;
+        for (size_t i = 0; i < blocks; ++i) {
+            const __m128i* s = reinterpret_cast<const __m128i*>(src + i * 64);
+            __m128i* d = reinterpret_cast<__m128i*>(dst + i * 64);
+            __m128i a = _mm_loadu_si128(s);
+            __m128i b = _mm_loadu_si128(s + 1);
+            __m128i c = _mm_loadu_si128(s + 2);
+            __m128i e = _mm_loadu_si128(s + 3);
+            _mm_stream_si128(d, a);
+            _mm_stream_si128(d + 1, b);
+            _mm_stream_si128(d + 2, c);
+            _mm_stream_si128(d + 3, e);
+        }
+        // Streaming stores are weakly ordered - fence before publishing the chunk
+        _mm_sfence();
+        size_t done = blocks * 64;
+        memcpy(dst + done, src + done, length - done);
+        return;
+    }
+#endif
+    memcpy(dst, src, length);
+}
+
 // =============================================================================
 // CHANNEL STRUCTURE
 // =============================================================================
@@ -48,6 +111,7 @@ struct Channel {
     
     uint8_t* base = nullptr;
     size_t total_size = 0;
+    uint32_t flags = 0;               // VS_CHANNEL_* actually in effect
     
     VS_Header* header = nullptr;
     uint8_t* py2ps_region = nullptr;  // Python → PowerShell data
@@ -58,32 +122,69 @@ struct Channel {
 // CHANNEL LIFECYCLE
 // =============================================================================
 
+VS_API int32_t VS_EnableLockMemoryPrivilege() {
+    // Token privileges are process-wide; adjust them once
+    static const bool enabled = enable_lock_memory_privilege();
+    return enabled ? 1 : 0;
+}
+
 VS_API VS_Channel VS_CreateChannel(const wchar_t* name, uint64_t frame_bytes) {
+    return VS_CreateChannelEx(name, frame_bytes, 0);
+}
+
+VS_API VS_Channel VS_CreateChannelEx(const wchar_t* name, uint64_t frame_bytes, uint32_t flags) {
     if (!name || frame_bytes == 0) {
         return nullptr;
     }
     
     auto ch = std::make_unique<Channel>();
     
-    // Calculate total size: header + two data regions
-    uint64_t header_size = sizeof(VS_Header);
-    uint64_t total = header_size + (frame_bytes * 2);
+    // Calculate total size: header + two data regions, each page-aligned
+    uint64_t header_size = align_up(sizeof(VS_Header), VS_REGION_ALIGN);
+    uint64_t region_stride = align_up(frame_bytes, VS_REGION_ALIGN);
+    uint64_t total = header_size + (region_stride * 2);
     
     if (total > SIZE_MAX) {
         return nullptr;
     }
     
+    HANDLE hMap = nullptr;
+    
+    // Large-page sections must be a multiple of the large page size and need
+    // SeLockMemoryPrivilege granted and enabled; fall back to regular pages
+    // when any of that fails.
+    if ((flags & VS_CHANNEL_LARGE_PAGES) && VS_EnableLockMemoryPrivilege()) {
+        uint64_t large_page = static_cast<uint64_t>(GetLargePageMinimum());
+        if (large_page != 0) {
+            uint64_t rounded = (total + large_page - 1) / large_page * large_page;
+            hMap = CreateFileMappingW(
+                INVALID_HANDLE_VALUE,
+                nullptr,
+                PAGE_READWRITE | SEC_COMMIT | SEC_LARGE_PAGES,
+                static_cast<DWORD>(rounded >> 32),
+                static_cast<DWORD>(rounded & 0xFFFFFFFF),
+                name
+            );
+            if (hMap) {
+                total = rounded;
+                ch->flags |= VS_CHANNEL_LARGE_PAGES;
+            }
+        }
+    }
+    
     ch->total_size = static_cast<size_t>(total);
     
     // Create file mapping
-    HANDLE hMap = CreateFileMappingW(
-        INVALID_HANDLE_VALUE,
-        nullptr,
-        PAGE_READWRITE,
-        static_cast<DWORD>(total >> 32),
-        static_cast<DWORD>(total & 0xFFFFFFFF),
-        name
-    );
+    if (!hMap) {
+        hMap = CreateFileMappingW(
+            INVALID_HANDLE_VALUE,
+            nullptr,
+            PAGE_READWRITE,
+            static_cast<DWORD>(total >> 32),
+            static_cast<DWORD>(total & 0xFFFFFFFF),
+            name
+        );
+    }
     
     if (!hMap) {
         return nullptr;
@@ -94,8 +195,9 @@ VS_API VS_Channel VS_CreateChannel(const wchar_t* name, uint64_t frame_bytes) {
     
     ch->hMap = hMap;
     
-    // Map view
-    void* view = MapViewOfFile(hMap, FILE_MAP_ALL_ACCESS, 0, 0, ch->total_size);
+    // Map view. An existing section is mapped whole: if it was created with
+    // large pages, views must cover a multiple of the large page size.
+    void* view = MapViewOfFile(hMap, FILE_MAP_ALL_ACCESS, 0, 0, existed ? 0 : ch->total_size);
     if (!view) {
         CloseHandle(hMap);
         return nullptr;
@@ -103,8 +205,6 @@ VS_API VS_Channel VS_CreateChannel(const wchar_t* name, uint64_t frame_bytes) {
     
     ch->base = static_cast<uint8_t*>(view);
     ch->header = reinterpret_cast<VS_Header*>(ch->base);
-    ch->py2ps_region = ch->base + header_size;
-    ch->ps2py_region = ch->py2ps_region + frame_bytes;
     
     // Initialize header if newly created
     if (!existed) {
@@ -119,8 +219,27 @@ VS_API VS_Channel VS_CreateChannel(const wchar_t* name, uint64_t frame_bytes) {
             CloseHandle(hMap);
             return nullptr;
         }
+        // The whole section is mapped, so lay the regions out from the
+        // creator's frame size - an opener passing a different frame_bytes
+        // would otherwise place ps2py (and every chunk copy) past the view
+        MEMORY_BASIC_INFORMATION info = {};
+        if (VirtualQuery(view, &info, sizeof(info)) == 0) {
+            UnmapViewOfFile(view);
+            CloseHandle(hMap);
+            return nullptr;
+        }
+        ch->total_size = info.RegionSize;
+        region_stride = align_up(ch->header->frame_bytes, VS_REGION_ALIGN);
+        if (header_size + region_stride * 2 > ch->total_size) {
+            UnmapViewOfFile(view);
+            CloseHandle(hMap);
+            return nullptr;
+        }
     }
     
+    ch->py2ps_region = ch->base + header_size;
+    ch->ps2py_region = ch->py2ps_region + region_stride;
+    
     // Create synchronization objects
     wchar_t mutex_name[256];
     wchar_t ev1[256], ev2[256], ev3[256], ev4[256];
@@ -158,6 +277,11 @@ VS_API VS_Channel VS_CreateChannel(const wchar_t* name, uint64_t frame_bytes) {
     return ch.release();
 }
 
+VS_API uint32_t VS_GetChannelFlags(VS_Channel handle) {
+    if (!handle) return 0;
+    return static_cast<Channel*>(handle)->flags;
+}
+
 VS_API void VS_DestroyChannel(VS_Channel handle) {
     if (!handle) return;
     
@@ -217,7 +341,7 @@ VS_API int32_t VS_SendPy2PsChunk(VS_Channel handle, uint32_t chunk_index, const
     }
     
     // Copy chunk to shared memory
-    memcpy(ch->py2ps_region, data, static_cast<size_t>(length));
+    copy_chunk(ch->py2ps_region, data, static_cast<size_t>(length));
     
     // Update metadata
     ch->header->py2ps.current_chunk = chunk_index;
@@ -262,6 +386,32 @@ VS_API int32_t VS_FinishPy2PsTransfer(VS_Channel handle) {
     return VS_OK;
 }
 
+VS_API int32_t VS_SendPy2PsAll(VS_Channel handle, const uint8_t* data, uint64_t total_size, uint64_t chunk_size, uint32_t timeout_ms, uint32_t* out_chunk_index) {
+    if (out_chunk_index) *out_chunk_index = VS_NO_CHUNK;
+    if (!handle || (!data && total_size) || !chunk_size) return VS_ERR_INVALID;
+    
+    int32_t result = VS_BeginPy2PsTransfer(handle, total_size, chunk_size);
+    if (result != VS_OK) return result;
+    
+    const uint64_t num_chunks = (total_size + chunk_size - 1) / chunk_size;
+    for (uint64_t i = 0; i < num_chunks; ++i) {
+        const uint64_t offset = i * chunk_size;
+        const uint64_t length = (total_size - offset < chunk_size) ? total_size - offset : chunk_size;
+        
+        result = VS_SendPy2PsChunk(handle, static_cast<uint32_t>(i), data + offset, length, timeout_ms);
+        if (result == VS_OK) {
+            result = VS_WaitPy2PsAck(handle, timeout_ms);
+        }
+        if (result != VS_OK) {
+            if (out_chunk_index) *out_chunk_index = static_cast<uint32_t>(i);
+            return result;
+        }
+    }
+    
+    if (out_chunk_index) *out_chunk_index = VS_NO_CHUNK;
+    return VS_FinishPy2PsTransfer(handle);
+}
+
 // =============================================================================
 // POWERSHELL → PYTHON TRANSFER
 // =============================================================================
@@ -304,7 +454,7 @@ VS_API int32_t VS_SendPs2PyChunk(VS_Channel handle, uint32_t chunk_index, const
     }
     
     // Copy chunk to shared memory
-    memcpy(ch->ps2py_region, data, static_cast<size_t>(length));
+    copy_chunk(ch->ps2py_region, data, static_cast<size_t>(length));
     
     // Update metadata
     ch->header->ps2py.current_chunk = chunk_index;
@@ -353,8 +503,8 @@ VS_API int32_t VS_FinishPs2PyTransfer(VS_Channel handle) {
 // ZERO-COPY RECEIVE (Python reads PowerShell chunks)
 // =============================================================================
 
-VS_API int32_t VS_WaitPs2PyChunk(VS_Channel handle, uint32_t* out_chunk_index, uint64_t* out_offset, uint64_t* out_length, uint32_t timeout_ms) {
-    if (!handle || !out_chunk_index || !out_offset || !out_length) {
+VS_API int32_t VS_WaitPs2PyChunkInfo(VS_Channel handle, VS_ChunkInfo* out_info, uint32_t timeout_ms) {
+    if (!handle || !out_info) {
         return VS_ERR_INVALID;
     }
     auto ch = static_cast<Channel*>(handle);
@@ -373,14 +523,30 @@ VS_API int32_t VS_WaitPs2PyChunk(VS_Channel handle, uint32_t* out_chunk_index, u
         return (mutex_wait == WAIT_TIMEOUT) ? VS_TIMEOUT : VS_ERR_SYSTEM;
     }
     
-    *out_chunk_index = ch->header->ps2py.current_chunk;
-    *out_offset = ch->header->ps2py.chunk_offset;
-    *out_length = ch->header->ps2py.chunk_length;
+    out_info->chunk_index = ch->header->ps2py.current_chunk;
+    out_info->reserved = 0;
+    out_info->offset = ch->header->ps2py.chunk_offset;
+    out_info->length = ch->header->ps2py.chunk_length;
     
     ReleaseMutex(ch->hMutex);
     return VS_OK;
 }
 
+VS_API int32_t VS_WaitPs2PyChunk(VS_Channel handle, uint32_t* out_chunk_index, uint64_t* out_offset, uint64_t* out_length, uint32_t timeout_ms) {
+    if (!out_chunk_index || !out_offset || !out_length) {
+        return VS_ERR_INVALID;
+    }
+    
+    VS_ChunkInfo info;
+    int32_t result = VS_WaitPs2PyChunkInfo(handle, &info, timeout_ms);
+    if (result == VS_OK) {
+        *out_chunk_index = info.chunk_index;
+        *out_offset = info.offset;
+        *out_length = info.length;
+    }
+    return result;
+}
+
 VS_API int32_t VS_AckPs2PyChunk(VS_Channel handle) {
     if (!handle) return VS_ERR_INVALID;
     auto ch = static_cast<Channel*>(handle);
@@ -399,6 +565,18 @@ VS_API int32_t VS_AckPs2PyChunk(VS_Channel handle) {
     return VS_OK;
 }
 
+VS_API int32_t VS_AckWaitPs2PyChunkInfo(VS_Channel handle, VS_ChunkInfo* out_info, uint32_t timeout_ms) {
+    if (!handle || !out_info) {
+        return VS_ERR_INVALID;
+    }
+    
+    int32_t result = VS_AckPs2PyChunk(handle);
+    if (result != VS_OK) {
+        return result;
+    }
+    return VS_WaitPs2PyChunkInfo(handle, out_info, timeout_ms);
+}
+
 VS_API int32_t VS_IsPs2PyComplete(VS_Channel handle) {
     if (!handle) return VS_ERR_INVALID;
     auto ch = static_cast<Channel*>(handle);
@@ -74,16 +74,21 @@ PYBIND11_MODULE(_core, m) {
         .def(py::init<const VirtualShell::Config&>())
 
         // Process control
-        .def("start",    &VirtualShell::start, "Start the PowerShell process")
-        .def("stop",     &VirtualShell::stop,  py::arg("force") = false, "Stop the PowerShell process")
+        .def("start",    &VirtualShell::start, py::call_guard<py::gil_scoped_release>(),
+             "Start the PowerShell process")
+        .def("stop",     &VirtualShell::stop,  py::arg("force") = false, py::call_guard<py::gil_scoped_release>(),
+             "Stop the PowerShell process")
         .def("is_alive", &VirtualShell::isAlive, "Check if the PowerShell process is running")
 
-        // Sync commands
+        // Sync commands. These block until PowerShell answers and touch no
+        // Python objects, so other Python threads keep running meanwhile.
         .def("execute", &VirtualShell::execute,
              py::arg("command"), py::arg("timeout_seconds") = 0.0,
+             py::call_guard<py::gil_scoped_release>(),
              "Execute a PowerShell command synchronously")
         .def("execute_batch", &VirtualShell::execute_batch,
              py::arg("commands"), py::arg("timeout_seconds") = 0.0,
+             py::call_guard<py::gil_scoped_release>(),
              "Execute a batch of PowerShell commands synchronously")
         .def("execute_script", &VirtualShell::execute_script,
              py::arg("script_path"),
@@ -91,6 +96,7 @@ PYBIND11_MODULE(_core, m) {
              py::arg("timeout_seconds") = 0.0,
              py::arg("dot_source") = false,
              py::arg("raise_on_error") = false,
+             py::call_guard<py::gil_scoped_release>(),
              "Execute a PowerShell script file synchronously")
         .def("execute_script_kv", &VirtualShell::execute_script_kv,
              py::arg("script_path"),
@@ -98,6 +104,7 @@ PYBIND11_MODULE(_core, m) {
              py::arg("timeout_seconds") = 0.0,
              py::arg("dot_source") = false,
              py::arg("raise_on_error") = false,
+             py::call_guard<py::gil_scoped_release>(),
              "Execute script with named parameters via hashtable splatting")
 
         // Async: single
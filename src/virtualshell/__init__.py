@@ -1,9 +1,16 @@
 from __future__ import annotations
 from importlib import import_module
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 import platform
 
 if TYPE_CHECKING:
+    from .errors import (
+        VirtualShellError,
+        PowerShellNotFoundError,
+        ExecutionTimeoutError,
+        ExecutionError,
+    )
     from .shell import ExecutionResult, BatchProgress, Shell, ExitCode
     from .zero_copy_bridge_shell import ZeroCopyBridge, PSObject
 
@@ -14,44 +21,33 @@ except Exception:
 
 from . import _globals as _g
 
-from .errors import (
-    VirtualShellError,
-    PowerShellNotFoundError,
-    ExecutionTimeoutError,
-    ExecutionError,
-)
-
-if platform.system() == 'Windows':
-    __all__ = [
-        "VirtualShellError", "PowerShellNotFoundError",
-        "ExecutionTimeoutError", "ExecutionError",
-        "__version__", "Shell", "ExecutionResult", "BatchProgress", "ExitCode",
-        "ZeroCopyBridge", "PSObject",
-    ]
-else:
-    __all__ = [
-        "VirtualShellError", "PowerShellNotFoundError",
-        "ExecutionTimeoutError", "ExecutionError",
-        "__version__", "Shell", "ExecutionResult", "BatchProgress", "ExitCode"
-    ]
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Public name -> submodule that defines it, resolved on first access
+_lazy_map = {
+    **{name: ".errors" for name in (
+        "VirtualShellError", "PowerShellNotFoundError", "ExecutionTimeoutError", "ExecutionError",
+    )},
+    **{name: ".shell" for name in ("Shell", "ExecutionResult", "BatchProgress", "ExitCode")},
+}
+_WINDOWS_ONLY = {name: ".zero_copy_bridge_shell" for name in ("ZeroCopyBridge", "PSObject")}
+if _IS_WINDOWS:
+    _lazy_map.update(_WINDOWS_ONLY)
+_LAZY_MAP = MappingProxyType(_lazy_map)
+del _lazy_map
+
+__all__ = ["__version__", *_LAZY_MAP]
 
 # Lazy loading of submodules and attributes to avoid importing compiled extension at package import time
 def __getattr__(name: str):
-    if name in {"Shell", "ExecutionResult", "BatchProgress", "ExitCode"}:
-        mod = import_module(".shell", __name__)
-        obj = getattr(mod, name)
-        globals()[name] = obj
-        return obj
-    if  name in {"ZeroCopyBridge", "PSObject"}:
-        if platform.system() == 'Windows':
-            mod = import_module(".zero_copy_bridge_shell", __name__)
-            obj = getattr(mod, name)
-            globals()[name] = obj
-            return obj
-        else:
+    mod_name = _LAZY_MAP.get(name)
+    if mod_name is None:
+        if name in _WINDOWS_ONLY:
             raise ImportError(f"{name} is only available on Windows platforms.")
-    
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(import_module(mod_name, __name__), name)
+    globals()[name] = obj
+    return obj
 
 def __dir__():
     return sorted(__all__)
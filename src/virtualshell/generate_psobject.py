@@ -7,6 +7,20 @@ from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple
 
+try:  # Optional: orjson parses large Get-Member dumps several times faster
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    _orjson = None
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when installed, falling back to the stdlib parser."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass  # Re-parse with the stdlib so errors look the same either way
+    return json.loads(text)
 
 
 DEFAULT_COMMAND = "Get-Process | Select-Object -First 1"
@@ -473,7 +487,7 @@ def fetch_members(shell, command: str) -> Tuple[str, List[MutableMapping[str, An
         raise RuntimeError("Get-Member returned no data")
 
     try:
-        members: Any = json.loads(raw_text)
+        members: Any = _json_loads(raw_text)
     except json.JSONDecodeError as exc:
         raise RuntimeError("Failed to parse Get-Member output as JSON") from exc
 
@@ -17,7 +17,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Dict, Optional, Callable, Any, Union, Protocol, TYPE_CHECKING, cast, overload, Sequence, TypeVar
 from concurrent.futures import Future
-from .generate_psobject import generate
 from . import _globals as _g
 
 _CPP_MODULE: Any = None
@@ -94,15 +93,7 @@ def quote_pwsh_literal(s: str) -> str:
     This is safe for *data-as-argument* scenarios, not for embedding raw code.
     Use it to construct commands like: `Write-Output {literal}`.
     """
-    if not s:
-        return "''"
-    out: List[str] = []
-    append = out.append
-    append("'")
-    for ch in s:
-        append("''" if ch == "'" else ch)
-    append("'")
-    return "".join(out)
+    return "'" + s.replace("'", "''") + "'"
 
 def _effective_timeout(user_timeout: Optional[float], default_seconds: float) -> float:
     """Resolve an effective timeout (seconds).
@@ -154,6 +145,20 @@ def _raise_on_failure(
         msg = err if err else f"{label} failed with exit_code={res.exit_code}"
         raise ExecutionError(msg)
 
+ScriptArg = Union[str, int, float]
+
+def _script_args(args: Optional[Iterable[ScriptArg]]) -> List[str]:
+    """Format positional script arguments; numbers are passed via str()."""
+    return [a if isinstance(a, str) else str(a) for a in (args or [])]
+
+def _script_named_args(args: Dict[str, ScriptArg]) -> Dict[str, str]:
+    """Format named script arguments; numbers are passed via str()."""
+    return {k: v if isinstance(v, str) else str(v) for k, v in args.items()}
+
+# Session scripts ship next to this module; _MODULE_DIR is already resolved.
+_RESTORE_SCRIPT_PATH = _g._MODULE_DIR / "get-session.ps1"
+_SAVE_SESSION_SCRIPT_PATH = _g._MODULE_DIR / "save-session.ps1"
+
 # ---------- Public API ----------
 class Shell:
     def __init__(
@@ -220,11 +225,11 @@ class Shell:
         if set_UTF8:
             cfg.initial_commands.insert(0, "$OutputEncoding = [Console]::OutputEncoding = [Text.UTF8Encoding]::new()")
 
-        module_dir = Path(__file__).resolve().parent
-        self._restore_script_path = module_dir / "get-session.ps1"
-        self._save_session_script_path = module_dir / "save-session.ps1"
+        self._restore_script_path = _RESTORE_SCRIPT_PATH
+        self._save_session_script_path = _SAVE_SESSION_SCRIPT_PATH
         self._python_run_id = secrets.token_hex(16)
         # Store session snapshots in the system temp directory to avoid polluting caller paths.
+        # Created per Shell: the temp directory may be cleaned while the process lives.
         session_dir = Path(tempfile.gettempdir()) / "virtualshell"
         session_dir.mkdir(parents=True, exist_ok=True)
         self._session_path = session_dir / f"session_{self._python_run_id}.xml"
@@ -389,7 +394,7 @@ class Shell:
     def script(
         self,
         script_path: Union[str, Path],
-        args: Optional[Union[Iterable[str], Dict[str, str]]] = None,
+        args: Optional[Union[Iterable[ScriptArg], Dict[str, ScriptArg]]] = None,
         *,
         timeout: Optional[float] = None,
         dot_source: bool = False,
@@ -398,6 +403,7 @@ class Shell:
         """Execute a script file with positional arguments.
         - `script_path` is the path to the script file to execute.
         - `args` is either a list of positional arguments or a dict of named arguments.
+          Values may be str, int or float; numbers are formatted with str().
         - `dot_source=True` runs in the current context (if supported by the backend),
           which can mutate session state. Use with care.
         - `raise_on_error` only affects Python-side exception raising; the backend
@@ -408,7 +414,7 @@ class Shell:
 
         if isinstance(args, dict) and args is not None:
             # Named args path.
-            named_args = dict(args)
+            named_args = _script_named_args(args)
             res: _CPP_ExecResult = self._core.execute_script_kv(
                 script_path=str(Path(script_path).resolve()),
                 named_args=named_args,
@@ -422,7 +428,7 @@ class Shell:
         
         res: _CPP_ExecResult = self._core.execute_script(
             script_path=str(Path(script_path).resolve()),
-            args=list(args or []) ,
+            args=_script_args(args),
             timeout_seconds=to,
             dot_source=bool(dot_source),
             raise_on_error=False,
@@ -434,7 +440,7 @@ class Shell:
     def script_async(
         self,
         script_path: Union[str, Path],
-        args: Optional[Union[Iterable[str], Dict[str, str]]] = None,
+        args: Optional[Union[Iterable[ScriptArg], Dict[str, ScriptArg]]] = None,
         callback: Optional[Callable[[ExecutionResult], None]] = None,
         *,
         timeout: Optional[float] = None,
@@ -446,7 +452,7 @@ class Shell:
 
         if isinstance(args, dict) and args is not None:
             # Named args path.
-            named_args = dict(args)
+            named_args = _script_named_args(args)
             fut = self._core.execute_async_script_kv(
                 script_path=str(Path(script_path).resolve()),
                 named_args=named_args,
@@ -478,7 +484,7 @@ class Shell:
                 pass
         fut = self._core.execute_async_script(
             script_path=str(Path(script_path).resolve()),
-            args=list(args or []),
+            args=_script_args(args),
             callback=_cb if callback else None,
             timeout_seconds=to,
             dot_source=bool(dot_source),
@@ -507,6 +513,8 @@ class Shell:
 
     def generate_psobject(self, command: str, output_path: Path) -> None:
         """Generate a PowerShell object from a command."""
+        # Imported on first use: the generator (regexes, optional orjson) is dev tooling
+        from .generate_psobject import generate
         return generate(self, command, output_path)
 
     def pwsh(self, s: str, timeout: Optional[float] = None, raise_on_error: bool = False) -> ExecutionResult:
@@ -537,9 +545,13 @@ class Shell:
         """Block if the backend process has restarted.
 
         - Only relevant if `auto_restart_on_timeout=True`.
-        - Polls `is_restarting` every `poll_interval` seconds.
+        - Polls `is_restarting` with exponential backoff, starting at 1 ms and
+          capped at `poll_interval` seconds, so short restarts are not rounded
+          up to a full interval.
         - Use with care: this is a blocking call that may wait indefinitely.
         """
+        delay = 0.001
         while self.is_restarting:
-            time.sleep(poll_interval)
-        return
\ No newline at end of file
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
+        return
\ No newline at end of file
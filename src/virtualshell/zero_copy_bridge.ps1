@@ -69,8 +69,11 @@ function Initialize-VSNative {
         $typeDefinition = @"
 using System;
 using System.Runtime.InteropServices;
+using System.Security;
 
 namespace VS.Native {
+    // Skips the per-call security stack walk (Windows PowerShell / .NET Framework)
+    [SuppressUnmanagedCodeSecurity]
     public static class V2 {
         private const string DllName = @"$loadedPath";
         
@@ -138,6 +141,126 @@ $script:VS_ERR_SYSTEM = -2
 $script:VS_ERR_BAD_STATE = -3
 $script:VS_ERR_TOO_LARGE = -4
 
+# =============================================================================
+# CHANNEL CACHE
+# =============================================================================
+
+# Opened channels keyed by "<full name>|<frame bytes>". Opening a channel
+# maps the whole shared segment, so the handle and view base are reused
+# across transfers and released only by Close-VSChannel.
+$script:VSChannelCache = @{}
+
+# Per-channel transfer settings registered once by Python (Register-VSChannel),
+# so the per-transfer commands only need to carry the variable and timeout.
+$script:VSChannelConfig = @{}
+
+# GC.AllocateUninitializedArray<byte> (.NET 5+) skips zeroing receive buffers
+# that are overwritten in full anyway; $null on Windows PowerShell.
+$script:VSAllocUninitialized = [System.GC].GetMethod('AllocateUninitializedArray')
+if ($script:VSAllocUninitialized) {
+    $script:VSAllocUninitialized = $script:VSAllocUninitialized.MakeGenericMethod([byte])
+}
+
+function Register-VSChannel {
+    <#
+    .SYNOPSIS
+        Remember frame size, chunk size and scope for a channel
+    
+    .PARAMETER ChannelName
+        Channel name (without Local\ or Global\ prefix)
+    #>
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory)]
+        [string]$ChannelName,
+        
+        [int]$FrameSizeMB = 64,
+        [int]$ChunkSizeMB = 4,
+        [ValidateSet('Local','Global')]
+        [string]$Scope = 'Local'
+    )
+    
+    $script:VSChannelConfig[$ChannelName] = [pscustomobject]@{
+        FrameSizeMB = $FrameSizeMB
+        ChunkSizeMB = $ChunkSizeMB
+        Scope       = $Scope
+    }
+}
+
+function Get-VSChannel {
+    <#
+    .SYNOPSIS
+        Return the cached channel (Handle, MemoryBase), opening it on first use
+    #>
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory)]
+        [string]$FullChannelName,
+        
+        [Parameter(Mandatory)]
+        [UInt64]$FrameBytes
+    )
+    
+    $key = "$FullChannelName|$FrameBytes"
+    $channel = $script:VSChannelCache[$key]
+    if ($null -ne $channel) {
+        return $channel
+    }
+    
+    # Open channel (Python should have created it)
+    $native = [VS.Native.V2]
+    $handle = $native::VS_CreateChannel($FullChannelName, $FrameBytes)
+    if ($handle -eq [IntPtr]::Zero) {
+        throw "Failed to open channel: $FullChannelName"
+    }
+    
+    $memBase = $native::VS_GetMemoryBase($handle)
+    if ($memBase -eq [IntPtr]::Zero) {
+        $native::VS_DestroyChannel($handle)
+        throw "Failed to get shared memory base"
+    }
+    
+    $channel = [pscustomobject]@{
+        Handle     = $handle
+        MemoryBase = $memBase
+    }
+    $script:VSChannelCache[$key] = $channel
+    return $channel
+}
+
+function Close-VSChannel {
+    <#
+    .SYNOPSIS
+        Release cached handles for a channel (the Python side still owns it)
+    
+    .PARAMETER ChannelName
+        Channel name (without Local\ or Global\ prefix)
+    #>
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory)]
+        [string]$ChannelName,
+        
+        [ValidateSet('Local','Global')]
+        [string]$Scope = 'Local'
+    )
+    
+    if ($ChannelName -like '*\*') {
+        $fullChannelName = $ChannelName
+    } else {
+        $fullChannelName = "$Scope\$ChannelName"
+    }
+    
+    $script:VSChannelConfig.Remove($ChannelName)
+    
+    foreach ($key in @($script:VSChannelCache.Keys)) {
+        if ($key.StartsWith("$fullChannelName|")) {
+            [VS.Native.V2]::VS_DestroyChannel($script:VSChannelCache[$key].Handle)
+            $script:VSChannelCache.Remove($key)
+        }
+    }
+}
+
 # =============================================================================
 # POWERSHELL API
 # =============================================================================
@@ -154,10 +277,10 @@ function Send-VariableToPython {
         Variable to send (with or without $)
     
     .PARAMETER ChunkSizeMB
-        Chunk size in MB (default: 4)
+        Chunk size in MB (default: registered value or 4)
     
     .PARAMETER FrameSizeMB
-        Frame size in MB (default: 64)
+        Frame size in MB (default: registered value or 64)
     
     .PARAMETER TimeoutSeconds
         Timeout in seconds (default: 30)
@@ -184,6 +307,13 @@ function Send-VariableToPython {
     
     Initialize-VSNative
     
+    $config = $script:VSChannelConfig[$ChannelName]
+    if ($null -ne $config) {
+        if (-not $PSBoundParameters.ContainsKey('ChunkSizeMB')) { $ChunkSizeMB = $config.ChunkSizeMB }
+        if (-not $PSBoundParameters.ContainsKey('FrameSizeMB')) { $FrameSizeMB = $config.FrameSizeMB }
+        if (-not $PSBoundParameters.ContainsKey('Scope')) { $Scope = $config.Scope }
+    }
+    
     $native = [VS.Native.V2]
     $chunkBytes = [UInt64]$ChunkSizeMB * 1024 * 1024
     $frameBytes = [UInt64]$FrameSizeMB * 1024 * 1024
@@ -196,20 +326,12 @@ function Send-VariableToPython {
         $fullChannelName = "$Scope\$ChannelName"
     }
     
-    # Open channel (Python should have created it)
-    $handle = $native::VS_CreateChannel($fullChannelName, $frameBytes)
-    if ($handle -eq [IntPtr]::Zero) {
-        throw "Failed to open channel: $fullChannelName"
-    }
-    
-    Write-Host "Channel opened: $handle" -ForegroundColor Cyan
+    $handle = (Get-VSChannel -FullChannelName $fullChannelName -FrameBytes $frameBytes).Handle
     
     try {
         # Allocate GCHandle (normal, not pinned - C++/CLI will handle the object)
         $gcHandle = [System.Runtime.InteropServices.GCHandle]::Alloc($Variable)
         
-        Write-Host "GCHandle created, calling VS_SendObjectPs2Py..." -ForegroundColor Cyan
-        
         try {
             # Use fast C++/CLI serialization and chunked send
             # Pass GCHandle as IntPtr (not AddrOfPinnedObject)
@@ -225,7 +347,7 @@ function Send-VariableToPython {
         }
     }
     finally {
-        # PowerShell does NOT destroy channel - Python owns it
+        # Channel handle stays cached - released by Close-VSChannel
     }
 }
 
@@ -241,7 +363,7 @@ function Receive-VariableFromPython {
         Variable name to store result (without $)
     
     .PARAMETER FrameSizeMB
-        Frame size in MB (default: 64)
+        Frame size in MB (default: registered value or 64)
     
     .PARAMETER TimeoutSeconds
         Timeout in seconds (default: 30)
@@ -267,10 +389,15 @@ function Receive-VariableFromPython {
     
     Initialize-VSNative
     
+    $config = $script:VSChannelConfig[$ChannelName]
+    if ($null -ne $config) {
+        if (-not $PSBoundParameters.ContainsKey('FrameSizeMB')) { $FrameSizeMB = $config.FrameSizeMB }
+        if (-not $PSBoundParameters.ContainsKey('Scope')) { $Scope = $config.Scope }
+    }
+    
     $native = [VS.Native.V2]
     $frameBytes = [UInt64]$FrameSizeMB * 1024 * 1024
     $timeoutMs = [UInt32]($TimeoutSeconds * 1000)
-    $completionPollMs = [int][Math]::Min(200, [Math]::Max(10, $TimeoutSeconds * 50))
     
     # Create channel name (use provided scope unless already qualified)
     if ($ChannelName -like '*\*') {
@@ -279,21 +406,16 @@ function Receive-VariableFromPython {
         $fullChannelName = "$Scope\$ChannelName"
     }
     
-    # Open channel (Python should have created it)
-    $handle = $native::VS_CreateChannel($fullChannelName, $frameBytes)
-    if ($handle -eq [IntPtr]::Zero) {
-        throw "Failed to open channel: $fullChannelName"
-    }
+    $channel = Get-VSChannel -FullChannelName $fullChannelName -FrameBytes $frameBytes
+    $handle = $channel.Handle
+    $memBase = $channel.MemoryBase
     
     try {
-        # Get shared memory base
-        $memBase = $native::VS_GetMemoryBase($handle)
-        if ($memBase -eq [IntPtr]::Zero) {
-            throw "Failed to get shared memory base"
-        }
-        
-        $chunks = [System.Collections.Generic.List[byte[]]]::new()
-        $totalSize = 0
+        # Transfer metadata is read straight from VS_Header once the first
+        # chunk is signalled: py2ps.total_size @16, py2ps.num_chunks @32
+        $data = $null
+        $numChunks = 0
+        $pos = 0
         
         while ($true) {
             # Wait for chunk
@@ -312,13 +434,23 @@ function Receive-VariableFromPython {
                 throw "VS_WaitPy2PsChunk failed: $result"
             }
             
-            # Read chunk from shared memory (ZERO-COPY READ!)
-            $chunkPtr = [IntPtr]::Add($memBase, [int]$offset)
-            $chunk = [byte[]]::new([int]$length)
-            [System.Runtime.InteropServices.Marshal]::Copy($chunkPtr, $chunk, 0, [int]$length)
+            if ($null -eq $data) {
+                $totalSize = [System.Runtime.InteropServices.Marshal]::ReadInt64($memBase, 16)
+                $numChunks = [System.Runtime.InteropServices.Marshal]::ReadInt32($memBase, 32)
+                if ($script:VSAllocUninitialized) {
+                    $data = [byte[]]$script:VSAllocUninitialized.Invoke($null, @([int]$totalSize, $false))
+                } else {
+                    $data = [byte[]]::new($totalSize)
+                }
+            }
+            if ($pos + [int64]$length -gt $data.Length) {
+                throw "Python sent more data than announced"
+            }
             
-            $chunks.Add($chunk)
-            $totalSize += $length
+            # Copy chunk from shared memory directly into the result
+            $chunkPtr = [IntPtr]::Add($memBase, [int]$offset)
+            [System.Runtime.InteropServices.Marshal]::Copy($chunkPtr, $data, $pos, [int]$length)
+            $pos += [int]$length
             
             # Acknowledge chunk
             $result = $native::VS_AckPy2PsChunk($handle)
@@ -326,40 +458,21 @@ function Receive-VariableFromPython {
                 throw "VS_AckPy2PsChunk failed: $result"
             }
             
-            # Check if complete
-            $isComplete = $native::VS_IsPy2PsComplete($handle)
-            if ($isComplete -ne 1 -and $completionPollMs -gt 0) {
-                $sw = [System.Diagnostics.Stopwatch]::StartNew()
-                while ($sw.ElapsedMilliseconds -lt $completionPollMs) {
-                    if ($native::VS_IsPy2PsComplete($handle) -eq 1) {
-                        $isComplete = 1
-                        break
-                    }
-                    Start-Sleep -Milliseconds 1
-                }
-            }
-            if ($isComplete -eq 1) {
+            # The last chunk ends the transfer - no need to poll for transfer_done
+            if ($chunkIndex + 1 -ge $numChunks) {
                 break
             }
         }
         
-        # Combine chunks
-        if ($chunks.Count -eq 1) {
-            $data = $chunks[0]
-        } else {
-            $data = [byte[]]::new($totalSize)
-            $pos = 0
-            foreach ($chunk in $chunks) {
-                [Array]::Copy($chunk, 0, $data, $pos, $chunk.Length)
-                $pos += $chunk.Length
-            }
+        if ($null -eq $data) {
+            $data = [byte[]]::new(0)
         }
         
         # Store in variable (in caller's scope)
         Set-Variable -Name $VariableName -Value $data -Scope 1
     }
     finally {
-        # PowerShell does NOT destroy channel - Python owns it
+        # Channel handle stays cached - released by Close-VSChannel
     }
 }
 
@@ -380,21 +493,34 @@ function Start-VSBridgeJob {
         - Handles all transfers asynchronously
         
         The job stays alive until stopped, handling multiple transfers.
+    
+    .PARAMETER TimeoutSeconds
+        How long to wait for the job to open the channel (default: 30).
+        On expiry the job is stopped and an error is thrown.
     #>
     [CmdletBinding()]
     param(
         [Parameter(Mandatory)]
         [string]$ChannelName,
         
-        [int]$FrameSizeMB = 64
+        [int]$FrameSizeMB = 64,
+        
+        [int]$TimeoutSeconds = 30
     )
     
     # Get paths to pass to job
     $dllPath = $script:VSNativeDllPath
     $scriptPath = $PSCommandPath
     
+    # Named event the job sets once the channel is open, so the caller waits
+    # exactly as long as the job needs instead of a fixed delay
+    $readyName = "Local\$ChannelName.job-ready"
+    $ready = [System.Threading.EventWaitHandle]::new($false, [System.Threading.EventResetMode]::ManualReset, $readyName)
+    
+    $jobName = "VSBridge.$ChannelName"
+    
     $jobScript = {
-        param($DllPath, $ScriptPath, $ChannelName, $FrameSizeMB)
+        param($DllPath, $ScriptPath, $ChannelName, $FrameSizeMB, $ReadyName, $StopName)
         
         # Load module in job context
         . $ScriptPath
@@ -402,36 +528,55 @@ function Start-VSBridgeJob {
         
         # Open channel (Python creates it, we just open)
         $fullChannelName = "Local\$ChannelName"
-        $channelHandle = [VS]::OpenChannel($fullChannelName)
+        $frameBytes = [uint64]$FrameSizeMB * 1MB
+        $channelHandle = [VS.Native.V2]::VS_CreateChannel($fullChannelName, $frameBytes)
         
         if ($channelHandle -eq [IntPtr]::Zero) {
             throw "Failed to open channel: $fullChannelName"
         }
         
-        Write-Output "Job: Channel opened: $channelHandle"
+        Write-Verbose "Job: Channel opened: $channelHandle"
+        
+        # Stop-VSBridgeJob sets this to end the job cleanly
+        $stop = [System.Threading.EventWaitHandle]::new($false, [System.Threading.EventResetMode]::ManualReset, $StopName)
         
         try {
-            # Keep job alive, waiting for commands via job communication
-            # For now, just keep it alive
-            while ($true) {
-                Start-Sleep -Milliseconds 100
-                
-                # Check if we should exit (parent will stop the job)
-                if ($using:ShouldExit) {
-                    break
-                }
-            }
+            $ready = [System.Threading.EventWaitHandle]::OpenExisting($ReadyName)
+            [void]$ready.Set()
+            $ready.Dispose()
+            
+            # Keep the job (and its channel handle) alive until Stop-VSBridgeJob.
+            # Short timed waits keep the pipeline stoppable, so a plain Stop-Job
+            # still breaks out and the finally block always runs.
+            while (-not $stop.WaitOne(100)) { }
         }
         finally {
-            # Channel is owned by Python, don't close it
-            Write-Output "Job: Exiting"
+            $stop.Dispose()
+            [VS.Native.V2]::VS_DestroyChannel($channelHandle)
+            Write-Verbose "Job: Exiting"
         }
     }
     
-    $job = Start-Job -ScriptBlock $jobScript -ArgumentList $dllPath, $scriptPath, $ChannelName, $FrameSizeMB
-    
-    # Wait a moment for job to start
-    Start-Sleep -Milliseconds 200
+    try {
+        $job = Start-Job -Name $jobName -ScriptBlock $jobScript -ArgumentList $dllPath, $scriptPath, $ChannelName, $FrameSizeMB, $readyName, "Local\$jobName.stop"
+        
+        # Wake on the ready signal; give up early if the job dies during startup,
+        # and stop it if it stays Running/Blocked without ever signalling
+        $deadline = [DateTime]::UtcNow.AddSeconds($TimeoutSeconds)
+        while (-not $ready.WaitOne(50)) {
+            if ($job.State -in 'Failed', 'Completed', 'Stopped') {
+                break
+            }
+            if ([DateTime]::UtcNow -ge $deadline) {
+                Stop-Job -Job $job
+                Remove-Job -Job $job -Force
+                throw "Timeout waiting for bridge job to open channel: $ChannelName"
+            }
+        }
+    }
+    finally {
+        $ready.Dispose()
+    }
     
     return $job
 }
@@ -447,8 +592,26 @@ function Stop-VSBridgeJob {
         [int]$JobId
     )
     
-    Stop-Job -Id $JobId -ErrorAction SilentlyContinue
-    Remove-Job -Id $JobId -Force -ErrorAction SilentlyContinue
+    $job = Get-Job -Id $JobId -ErrorAction SilentlyContinue
+    if ($null -eq $job) {
+        return
+    }
+    
+    # Ask the job to exit on its own so it releases the channel, then fall
+    # back to Stop-Job if it does not finish in time
+    $stop = $null
+    if ([System.Threading.EventWaitHandle]::TryOpenExisting("Local\$($job.Name).stop", [ref]$stop)) {
+        try {
+            [void]$stop.Set()
+        }
+        finally {
+            $stop.Dispose()
+        }
+        [void](Wait-Job -Job $job -Timeout 5)
+    }
+    
+    Stop-Job -Job $job -ErrorAction SilentlyContinue
+    Remove-Job -Job $job -Force -ErrorAction SilentlyContinue
 }
 
 function Start-SendVariableToPythonJob {
@@ -489,23 +652,23 @@ function Start-SendVariableToPythonJob {
         param($ScriptPath, $DllPath, $ChannelName, $Variable, $ChunkSizeMB, $TimeoutSeconds, $Scope)
         
         try {
-            Write-Output "[ThreadJob] Starting..."
-            Write-Output "[ThreadJob] ScriptPath: $ScriptPath"
-            Write-Output "[ThreadJob] DllPath: $DllPath"
-            Write-Output "[ThreadJob] ChannelName: $ChannelName"
+            Write-Verbose "[ThreadJob] Starting..."
+            Write-Verbose "[ThreadJob] ScriptPath: $ScriptPath"
+            Write-Verbose "[ThreadJob] DllPath: $DllPath"
+            Write-Verbose "[ThreadJob] ChannelName: $ChannelName"
             
             # Re-source the module in ThreadJob
-            Write-Output "[ThreadJob] Sourcing module..."
+            Write-Verbose "[ThreadJob] Sourcing module..."
             . $ScriptPath
             
-            Write-Output "[ThreadJob] Initializing DLL..."
+            Write-Verbose "[ThreadJob] Initializing DLL..."
             Initialize-VSNative -PreferredPath $DllPath
             
-            Write-Output "[ThreadJob] Calling Send-VariableToPython..."
+            Write-Verbose "[ThreadJob] Calling Send-VariableToPython..."
             # Now we have access to functions and [VS] type
             Send-VariableToPython -ChannelName $ChannelName -Variable $Variable -ChunkSizeMB $ChunkSizeMB -TimeoutSeconds $TimeoutSeconds -Scope $Scope
             
-            Write-Output "[ThreadJob] Send completed successfully"
+            Write-Verbose "[ThreadJob] Send completed successfully"
         }
         catch {
             Write-Error "[ThreadJob] ERROR: $_"
@@ -555,20 +718,20 @@ function Start-ReceiveVariableFromPythonJob {
         param($ScriptPath, $DllPath, $ChannelName, $VariableName, $TimeoutSeconds, $Scope)
         
         try {
-            Write-Output "[ThreadJob-Receive] Starting..."
+            Write-Verbose "[ThreadJob-Receive] Starting..."
             
             # Re-source the module in ThreadJob
-            Write-Output "[ThreadJob-Receive] Sourcing module..."
+            Write-Verbose "[ThreadJob-Receive] Sourcing module..."
             . $ScriptPath
             
-            Write-Output "[ThreadJob-Receive] Initializing DLL..."
+            Write-Verbose "[ThreadJob-Receive] Initializing DLL..."
             Initialize-VSNative -PreferredPath $DllPath
             
-            Write-Output "[ThreadJob-Receive] Calling Receive-VariableFromPython..."
+            Write-Verbose "[ThreadJob-Receive] Calling Receive-VariableFromPython..."
             # Receive data
             Receive-VariableFromPython -ChannelName $ChannelName -VariableName 'data' -TimeoutSeconds $TimeoutSeconds -Scope $Scope
             
-            Write-Output "[ThreadJob-Receive] Received $($data.Length) bytes"
+            Write-Verbose "[ThreadJob-Receive] Received $($data.Length) bytes"
             # Return data from job
             return $data
         }
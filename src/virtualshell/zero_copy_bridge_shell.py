@@ -7,17 +7,25 @@ Design:
 - Zero-copy via memoryview of shared memory
 """
 import ctypes
+import itertools
+import mmap
 import os
-import time
+import struct
+import weakref
 from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, List, Optional, TYPE_CHECKING, Type, Dict
+from typing import Any, Callable, List, Optional, Set, TYPE_CHECKING, Type, Dict
 from datetime import datetime
 import base64
 import json
 from dataclasses import dataclass
 from . import _globals as _g
 
+try:  # Optional: lxml (libxml2) parses large CliXml documents much faster
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
 if TYPE_CHECKING:
     from .shell import Shell
 
@@ -42,6 +50,9 @@ def _load_win_dll() -> tuple[Optional[Path], Optional[ctypes.CDLL]]:
 # Load DLL (Windows only)
 _dll_path, _dll = _load_win_dll()
 
+# PowerShell side of the bridge, resolved once at import
+_BRIDGE_SCRIPT_PATH = _g._MODULE_DIR / "zero_copy_bridge.ps1"
+
 # Status codes
 VS_OK = 0
 VS_TIMEOUT = 1
@@ -51,19 +62,61 @@ VS_ERR_SYSTEM = -2
 VS_ERR_BAD_STATE = -3
 VS_ERR_TOO_LARGE = -4
 
+# Slice size used when feeding a non-bytes buffer to lxml
+_XML_FEED_BYTES = 1024 * 1024
+
+# Memoryview receives at least this large land in anonymous mmap memory, whose
+# pages are zero-filled lazily by the OS instead of up front like a bytearray
+_MMAP_RECEIVE_BYTES = 64 * 1024 * 1024
+
+# VS_CreateChannelEx flags
+VS_CHANNEL_LARGE_PAGES = 0x1
+
+# VS_SendPy2PsAll chunk index when Begin or Finish failed rather than a chunk
+VS_NO_CHUNK = 0xFFFFFFFF
+
+# VS_REGION_ALIGN in vs_shm.h: the header is padded to it and the py2ps and
+# ps2py regions each span a multiple of it
+_VS_REGION_ALIGN = 4096
+# VS_Header.ps2py transfer plan written by VS_BeginPs2PyTransfer:
+# total_size u64 @64, chunk_size u64 @72, num_chunks u32 @80
+_VS_PS2PY_PLAN_OFFSET = 64
+_VS_PS2PY_PLAN = struct.Struct("<QQI")
+
+class _VSChunkInfo(ctypes.Structure):
+    """VS_ChunkInfo in vs_shm.h, filled by VS_WaitPs2PyChunkInfo."""
+    _fields_ = [
+        ("chunk_index", ctypes.c_uint32),
+        ("reserved", ctypes.c_uint32),
+        ("offset", ctypes.c_uint64),
+        ("length", ctypes.c_uint64),
+    ]
+
+# Per-process channel counter; pid + counter is unique without a clock read
+_CHANNEL_IDS = itertools.count()
+
 # Function signatures
 if _dll is not None:
     _dll.VS_CreateChannel.argtypes = [ctypes.c_wchar_p, ctypes.c_uint64]
     _dll.VS_CreateChannel.restype = ctypes.c_void_p
 
+    _dll.VS_CreateChannelEx.argtypes = [ctypes.c_wchar_p, ctypes.c_uint64, ctypes.c_uint32]
+    _dll.VS_CreateChannelEx.restype = ctypes.c_void_p
+
     _dll.VS_DestroyChannel.argtypes = [ctypes.c_void_p]
     _dll.VS_DestroyChannel.restype = None
 
+    _dll.VS_GetChannelFlags.argtypes = [ctypes.c_void_p]
+    _dll.VS_GetChannelFlags.restype = ctypes.c_uint32
+
+    _dll.VS_EnableLockMemoryPrivilege.argtypes = []
+    _dll.VS_EnableLockMemoryPrivilege.restype = ctypes.c_int32
+
     _dll.VS_BeginPy2PsTransfer.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint64]
     _dll.VS_BeginPy2PsTransfer.restype = ctypes.c_int32
 
     _dll.VS_SendPy2PsChunk.argtypes = [
-        ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_ubyte),
+        ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p,
         ctypes.c_uint64, ctypes.c_uint32
     ]
     _dll.VS_SendPy2PsChunk.restype = ctypes.c_int32
@@ -74,24 +127,164 @@ if _dll is not None:
     _dll.VS_FinishPy2PsTransfer.argtypes = [ctypes.c_void_p]
     _dll.VS_FinishPy2PsTransfer.restype = ctypes.c_int32
 
-    _dll.VS_WaitPs2PyChunk.argtypes = [
-        ctypes.c_void_p,
-        ctypes.POINTER(ctypes.c_uint32),
-        ctypes.POINTER(ctypes.c_uint64),
-        ctypes.POINTER(ctypes.c_uint64),
-        ctypes.c_uint32
+    _dll.VS_SendPy2PsAll.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64,
+        ctypes.c_uint64, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32)
+    ]
+    _dll.VS_SendPy2PsAll.restype = ctypes.c_int32
+
+    _dll.VS_WaitPs2PyChunkInfo.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(_VSChunkInfo), ctypes.c_uint32
     ]
-    _dll.VS_WaitPs2PyChunk.restype = ctypes.c_int32
+    _dll.VS_WaitPs2PyChunkInfo.restype = ctypes.c_int32
 
     _dll.VS_AckPs2PyChunk.argtypes = [ctypes.c_void_p]
     _dll.VS_AckPs2PyChunk.restype = ctypes.c_int32
 
+    _dll.VS_AckWaitPs2PyChunkInfo.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(_VSChunkInfo), ctypes.c_uint32
+    ]
+    _dll.VS_AckWaitPs2PyChunkInfo.restype = ctypes.c_int32
+
     _dll.VS_IsPs2PyComplete.argtypes = [ctypes.c_void_p]
     _dll.VS_IsPs2PyComplete.restype = ctypes.c_int32
 
     _dll.VS_GetMemoryBase.argtypes = [ctypes.c_void_p]
     _dll.VS_GetMemoryBase.restype = ctypes.c_void_p
 
+# =============================================================================
+# RECEIVE BUFFERS
+# =============================================================================
+
+_MEM_COMMIT = 0x1000
+_MEM_RESERVE = 0x2000
+_MEM_RELEASE = 0x8000
+_MEM_LARGE_PAGES = 0x20000000
+_PAGE_READWRITE = 0x04
+
+_kernel32 = ctypes.WinDLL("kernel32") if _IS_WINDOWS else None
+if _kernel32 is not None:
+    _kernel32.VirtualAlloc.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint32, ctypes.c_uint32]
+    _kernel32.VirtualAlloc.restype = ctypes.c_void_p
+
+    _kernel32.VirtualFree.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint32]
+    _kernel32.VirtualFree.restype = ctypes.c_int
+
+    _kernel32.GetLargePageMinimum.argtypes = []
+    _kernel32.GetLargePageMinimum.restype = ctypes.c_size_t
+
+
+def _alloc_large_pages(size: int) -> Optional[ctypes.Array]:
+    """VirtualAlloc a large-page buffer of at least `size` bytes.
+
+    Returns None when large pages are unsupported or SeLockMemoryPrivilege is
+    not granted. MEM_LARGE_PAGES also needs the privilege enabled in the token,
+    which the DLL does once per process (the same helper large-page channels
+    use). The memory is released when the returned array is collected.
+    """
+    if _kernel32 is None or _dll is None or not _dll.VS_EnableLockMemoryPrivilege():
+        return None
+    large_page = _kernel32.GetLargePageMinimum()
+    if not large_page:
+        return None
+    rounded = -(-size // large_page) * large_page
+    addr = _kernel32.VirtualAlloc(
+        None, rounded, _MEM_COMMIT | _MEM_RESERVE | _MEM_LARGE_PAGES, _PAGE_READWRITE
+    )
+    if not addr:
+        return None
+    buf = (ctypes.c_ubyte * rounded).from_address(addr)
+    weakref.finalize(buf, _kernel32.VirtualFree, addr, 0, _MEM_RELEASE)
+    return buf
+
+# =============================================================================
+# SEND BUFFERS
+# =============================================================================
+
+class _PyBuffer(ctypes.Structure):
+    """Py_buffer, filled by PyObject_GetBuffer."""
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),  # owned reference, dropped by PyBuffer_Release
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_PyBUF_SIMPLE = 0
+
+ctypes.pythonapi.PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+ctypes.pythonapi.PyObject_GetBuffer.restype = ctypes.c_int
+
+ctypes.pythonapi.PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+ctypes.pythonapi.PyBuffer_Release.restype = None
+
+# =============================================================================
+# CLIXML SCALARS
+# =============================================================================
+
+def _clixml_int(text: str) -> tuple[Any, Type[Any]]:
+    try:
+        return int(text), int
+    except ValueError:
+        return 0, int
+
+
+def _clixml_float(text: str) -> tuple[Any, Type[Any]]:
+    try:
+        return float(text), float
+    except ValueError:
+        return 0.0, float
+
+
+def _clixml_datetime(text: str) -> tuple[Any, Type[Any]]:
+    try:
+        # PowerShell DateTime format: 2025-11-08T10:30:45.1234567-05:00
+        return datetime.fromisoformat(text.replace('Z', '+00:00')), datetime
+    except (ValueError, AttributeError):
+        return text, str
+
+
+def _clixml_base64(text: str) -> tuple[Any, Type[Any]]:
+    try:
+        return base64.b64decode(text), bytes
+    except Exception:
+        return text, str
+
+
+def _clixml_text(text: str) -> tuple[Any, Type[Any]]:
+    # S, TS (P0DT0H0M5.123S - kept as text), URI, Version, G, SBK
+    return text, str
+
+
+# Leaf tag -> parser for the element text. One dict lookup per element instead
+# of walking an if/elif chain; container tags (LST, Obj, Ref, Nil) are handled
+# in PSObject._parse_value because they need the element itself.
+_CLIXML_SCALARS: Dict[str, Callable[[str], tuple[Any, Type[Any]]]] = {
+    "S": _clixml_text,
+    "B": lambda text: (text.lower() == "true", bool),
+    **dict.fromkeys(("I32", "I16", "I64", "U32", "U16", "U64", "By", "SByte"), _clixml_int),
+    **dict.fromkeys(("Sg", "Db", "D"), _clixml_float),
+    "DT": _clixml_datetime,
+    "TS": _clixml_text,
+    "C": lambda text: (text[0] if text else '', str),
+    "URI": _clixml_text,
+    "Version": _clixml_text,
+    "G": _clixml_text,
+    "BA": _clixml_base64,
+    "SBK": _clixml_text,
+    # SecureString (can't decrypt, return placeholder)
+    "SS": lambda text: ("<SecureString>", str),
+}
+
+
 class PSObject:
     """Dataclass representing a PowerShell object.
     
@@ -103,8 +296,13 @@ class PSObject:
         name = ps_obj.get_property("Name").value
     """
     
+    # Parsed collections create one PSObject/Property per element - no per-instance dict
+    __slots__ = ("type_name", "properties")
+
     @dataclass
     class Property:
+        __slots__ = ("name", "type", "value")
+
         name: str
         type: Type[Any]
         value: Any
@@ -193,11 +391,9 @@ class PSObject:
             for prop_name, prop in self.properties.items():
                 self._serialize_value(ms_elem, prop.value, prop_name, prop.type)
         
-        # Convert to string with XML declaration
-        xml_str = '<?xml version="1.0" encoding="utf-8"?>\n'
-        xml_str += ET.tostring(root, encoding='unicode')
-        
-        return xml_str.encode('utf-8')
+        # Serialize straight to UTF-8 bytes (no declaration is emitted for
+        # utf-8) instead of building a str and encoding a copy of it
+        return b'<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(root, encoding='utf-8')
     
     @staticmethod
     def _serialize_value(parent: Any, value: Any, name: str, value_type: Type[Any]) -> None:
@@ -285,11 +481,12 @@ class PSObject:
             ET.SubElement(parent, "S", {"N": name}).text = str(value)
     
     @staticmethod
-    def from_bytes(data: bytes) -> "PSObject":
+    def from_bytes(data: bytes | bytearray | memoryview) -> "PSObject":
         """Parse PowerShell CliXml-serialized bytes into PSObject.
         
         Args:
-            data: Bytes from PowerShell (CliXml format)
+            data: Bytes from PowerShell (CliXml format). A memoryview from
+                receive(..., return_memoryview=True) is parsed without copying it whole.
         
         Returns:
             PSObject with parsed properties
@@ -297,12 +494,10 @@ class PSObject:
         Raises:
             ValueError: If data is not valid CliXml
         """
-        import xml.etree.ElementTree as ET
-        
         try:
-            # CliXml uses UTF-8 encoding
-            xml_str = data.decode('utf-8')
-            root = ET.fromstring(xml_str)
+            # Parse the raw bytes - the XML prolog carries the encoding (UTF-8),
+            # so there is no need to decode to str first
+            root = PSObject._parse_xml(data)
         except Exception as e:
             raise ValueError(f"Failed to parse CliXml: {e}") from e
         
@@ -321,25 +516,55 @@ class PSObject:
         
         return PSObject._parse_object(obj_elem, ns)
     
+    @staticmethod
+    def _parse_xml(data: bytes | bytearray | memoryview) -> Any:
+        """Parse CliXml into an element tree without materialising a second full copy."""
+        if _lxml_etree is None:
+            import xml.etree.ElementTree as ET
+            # expat reads any buffer-protocol object directly
+            return ET.fromstring(data)
+        
+        parser = _lxml_etree.XMLParser(huge_tree=True, resolve_entities=False)
+        if isinstance(data, bytes):
+            return _lxml_etree.fromstring(data, parser)
+        
+        # lxml only accepts bytes - feed bounded slices instead of bytes(data)
+        view = memoryview(data)
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+        for start in range(0, view.nbytes, _XML_FEED_BYTES):
+            parser.feed(view[start:start + _XML_FEED_BYTES].tobytes())
+        return parser.close()
+
+    @staticmethod
+    def _find(elem, tag: str, ns: dict) -> Any:
+        """Find a child by tag with or without the CliXml namespace.
+        
+        Compares against None explicitly: element truthiness means "has children"
+        (and warns under lxml), so `find(...) or find(...)` skipped empty elements.
+        """
+        found = elem.find(f"ps:{tag}", ns)
+        return found if found is not None else elem.find(tag)
+
     @staticmethod
     def _parse_object(obj_elem, ns: Optional[dict] = None) -> "PSObject":
         """Parse a single <Obj> element."""
-        import xml.etree.ElementTree as ET
-        
         if ns is None:
             ns = {}
         
         # Get type name from TN (TypeName) element
         type_name = "PSCustomObject"
-        tn_elem = obj_elem.find("ps:TN", ns) or obj_elem.find("TN")
+        tn_elem = PSObject._find(obj_elem, "TN", ns)
         if tn_elem is not None:
-            # Get all type names (first one is the most specific)
-            type_names = [t.text for t in tn_elem.findall("ps:T", ns) or tn_elem.findall("T") if t.text]
-            if type_names:
-                type_name = type_names[0]  # Use first (most specific) type
+            # <TN> only holds <T> entries, most specific first - stop at the
+            # first one instead of collecting the whole hierarchy
+            for t in tn_elem:
+                if t.text:
+                    type_name = t.text
+                    break
         
         # Check if this is an array type (has LST directly under Obj)
-        lst_elem = obj_elem.find("ps:LST", ns) or obj_elem.find("LST")
+        lst_elem = PSObject._find(obj_elem, "LST", ns)
         
         if lst_elem is not None and ("[]" in type_name or "Array" in type_name):
             # This is an array - parse items from LST and return as a special property
@@ -356,17 +581,19 @@ class PSObject:
             )]
             return PSObject(type_name, properties)
         
-        # Find <Props> or <MS> (MemberSet) element for regular objects
-        props_elem = obj_elem.find("ps:MS", ns) or obj_elem.find("MS") or obj_elem.find("ps:Props", ns) or obj_elem.find("Props")
+        # Find <MS> (MemberSet) or <Props> element for regular objects. An
+        # empty <MS/> must not hide a populated <Props> next to it.
+        props_elem = PSObject._find(obj_elem, "MS", ns)
+        if props_elem is None or len(props_elem) == 0:
+            fallback = PSObject._find(obj_elem, "Props", ns)
+            if fallback is not None:
+                props_elem = fallback
         
         properties = []
         
         if props_elem is not None:
             # Parse each property
             for prop_elem in props_elem:
-                # Remove namespace from tag
-                tag = prop_elem.tag.split('}')[-1] if '}' in prop_elem.tag else prop_elem.tag
-                
                 prop_name = prop_elem.get("N")  # Property name
                 if not prop_name:
                     continue
@@ -389,61 +616,19 @@ class PSObject:
         Returns:
             (value, type) tuple
         """
-        from datetime import datetime
-        
         if ns is None:
             ns = {}
         
         # Remove namespace from tag
-        tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-        text = elem.text or ""
-        
-        # String
-        if tag == "S":
-            return text, str
-        
-        # Boolean
-        elif tag == "B":
-            return text.lower() == "true", bool
-        
-        # Integer types
-        elif tag in ("I32", "I16", "I64", "U32", "U16", "U64", "By", "SByte"):
-            try:
-                return int(text), int
-            except ValueError:
-                return 0, int
-        
-        # Floating point
-        elif tag in ("Sg", "Db", "D"):
-            try:
-                return float(text), float
-            except ValueError:
-                return 0.0, float
-        
-        # DateTime
-        elif tag == "DT":
-            try:
-                # PowerShell DateTime format: 2025-11-08T10:30:45.1234567-05:00
-                dt = datetime.fromisoformat(text.replace('Z', '+00:00'))
-                return dt, datetime
-            except (ValueError, AttributeError):
-                return text, str
-        
-        # TimeSpan (duration)
-        elif tag == "TS":
-            try:
-                # PowerShell TimeSpan format: P0DT0H0M5.123S or PT5.123S
-                # For now, return as string (could parse to timedelta)
-                return text, str
-            except Exception:
-                return text, str
+        tag = elem.tag.rpartition('}')[2]
         
-        # Char
-        elif tag == "C":
-            return text[0] if text else '', str
+        # Leaf values (strings, numbers, dates, ...)
+        parse = _CLIXML_SCALARS.get(tag)
+        if parse is not None:
+            return parse(elem.text or "")
         
         # Null
-        elif tag == "Nil":
+        if tag == "Nil":
             return None, type(None)
         
         # Array/List
@@ -469,7 +654,7 @@ class PSObject:
                     pass  # Fall through to object parsing
             
             # Check if it's an array by looking for LST child
-            lst_elem = elem.find("ps:LST", ns) or elem.find("LST")
+            lst_elem = PSObject._find(elem, "LST", ns)
             if lst_elem is not None:
                 # It's an array - parse items from LST
                 items = []
@@ -479,7 +664,7 @@ class PSObject:
                 return items, list
             
             # Check if it's a dictionary/hashtable by looking for DCT child
-            dct_elem = elem.find("ps:DCT", ns) or elem.find("DCT")
+            dct_elem = PSObject._find(elem, "DCT", ns)
             if dct_elem is not None:
                 # It's a hashtable - parse key-value pairs
                 result = {}
@@ -510,37 +695,9 @@ class PSObject:
             ref_id = elem.get("RefId", "")
             return f"<Ref:{ref_id}>", str
         
-        # URI
-        elif tag == "URI":
-            return text, str
-        
-        # Version
-        elif tag == "Version":
-            return text, str
-        
-        # Guid
-        elif tag == "G":
-            return text, str
-        
-        # Base64 binary data
-        elif tag == "BA":
-            try:
-                import base64
-                return base64.b64decode(text), bytes
-            except Exception:
-                return text, str
-        
-        # ScriptBlock
-        elif tag == "SBK":
-            return text, str
-        
-        # SecureString (can't decrypt, return placeholder)
-        elif tag == "SS":
-            return "<SecureString>", str
-        
         # Unknown type - return as string
         else:
-            return text, str
+            return elem.text or "", str
         
     def to_dict(
         self,
@@ -637,7 +794,10 @@ class ZeroCopyBridge:
         shell: "Shell",
         frame_mb: int = 64,
         chunk_mb: int = 4,
-        scope: str = "Local"
+        scope: str = "Local",
+        prefault: bool = False,
+        large_pages: bool = False,
+        force_reload: bool = False
     ):
         """Initialize bridge with Shell instance.
         
@@ -647,11 +807,18 @@ class ZeroCopyBridge:
             frame_mb: Frame size in MB (per direction)
             chunk_mb: Default chunk size in MB
             scope: "Local" or "Global"
+            prefault: Touch every page of the shared frame up front (see prefault())
+            large_pages: Back the frame with large pages. SeLockMemoryPrivilege
+                must be granted to the account; the DLL enables it in the process
+                token. Falls back to regular pages otherwise - check the
+                `large_pages` attribute for what was actually used.
+            force_reload: Re-run the PowerShell bootstrap even if the bridge
+                script is already loaded in this session
         """
         dll = _dll
         if dll is None:
             raise RuntimeError("ZeroCopyBridge requires win_pwsh.dll and is only available on Windows")
-        channel_name = f"vs_{os.getpid()}_{int(time.time())}"
+        channel_name = f"vs_{os.getpid()}_{next(_CHANNEL_IDS)}"
         self.shell = shell
         self.channel_name = f"{scope}\\{channel_name}"
         self.channel_name_short = channel_name  # Without prefix
@@ -659,13 +826,16 @@ class ZeroCopyBridge:
         self.frame_bytes = frame_mb * 1024 * 1024
         self.default_chunk_bytes = chunk_mb * 1024 * 1024
         self._active_jobs = []  # Track active PowerShell jobs
-        self._active_futures: List[Future[Any]] = []
+        self._active_futures: Set[Future[Any]] = set()
         self._dll = dll
         
         # Create channel (Python owns it)
-        self._handle = dll.VS_CreateChannel(self.channel_name, self.frame_bytes)
+        flags = VS_CHANNEL_LARGE_PAGES if large_pages else 0
+        self._handle = dll.VS_CreateChannelEx(self.channel_name, self.frame_bytes, flags)
         if not self._handle:
             raise RuntimeError(f"Failed to create channel: {self.channel_name}")
+        # Whether the frame really is large-page backed (requests can fall back)
+        self.large_pages = bool(dll.VS_GetChannelFlags(self._handle) & VS_CHANNEL_LARGE_PAGES)
         
         # Get shared memory base
         self._mem_base = dll.VS_GetMemoryBase(self._handle)
@@ -674,40 +844,54 @@ class ZeroCopyBridge:
             raise RuntimeError("Failed to get shared memory base")
         
         self._mem_base_addr = self._mem_base if isinstance(self._mem_base, int) else self._mem_base.value
+        self._ps2py_plan = memoryview(
+            (ctypes.c_ubyte * _VS_PS2PY_PLAN.size).from_address(self._mem_base_addr + _VS_PS2PY_PLAN_OFFSET)
+        )
         
         # Load PowerShell bridge module
-        bridge_script = Path(__file__).parent / "zero_copy_bridge.ps1"
+        bridge_script = _BRIDGE_SCRIPT_PATH
         dll_path = _dll_path
         if dll_path is None:
             raise RuntimeError("win_pwsh.dll path is unavailable")
         
-        # Store paths for job execution
-        self._ps_script_path = str(bridge_script.absolute())
-        self._ps_dll_path = str(dll_path.absolute())
-        
-        # Load PowerShell bridge script (set execution policy bypass for this session)
-        self.shell.run("Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass -Force")
-        self.shell.run(f". '{bridge_script}'")
-        init_cmd = f"Initialize-VSNative -PreferredPath '{self._ps_dll_path}'"
-        self.shell.run(init_cmd)
+        # Store paths for job execution (both derive from the resolved module dir)
+        self._ps_script_path = str(bridge_script)
+        self._ps_dll_path = str(dll_path)
+        
+        # Load PowerShell bridge script (set execution policy bypass for this session).
+        # The bootstrap is skipped when this session already has the bridge loaded,
+        # so further bridges on the same shell cost a single round-trip.
+        bootstrap = (
+            "Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass -Force; "
+            f". '{bridge_script}'; "
+            f"Initialize-VSNative -PreferredPath '{self._ps_dll_path}'"
+        )
+        if not force_reload:
+            bootstrap = f"if (-not (Test-Path Function:\\Register-VSChannel)) {{ {bootstrap} }}"
+        self.shell.run(
+            f"{bootstrap}; "
+            f"Register-VSChannel -ChannelName '{channel_name}' -FrameSizeMB {frame_mb} "
+            f"-ChunkSizeMB {chunk_mb} -Scope '{scope}'"
+        )
+
+        # Fixed parts of the per-transfer commands, built once per bridge
+        self._send_cmd_prefix = f"Send-VariableToPython -ChannelName '{channel_name}' -Variable $"
+        self._recv_cmd_prefix = f"Receive-VariableFromPython -ChannelName '{channel_name}' -VariableName '"
+
+        if prefault:
+            self.prefault()
     
     def __del__(self):
-        # Clean up any active jobs
-        if hasattr(self, '_active_jobs'):
-            for job_id in self._active_jobs:
-                try:
-                    self.shell.run(f"Stop-Job -Id {job_id} -ErrorAction SilentlyContinue; Remove-Job -Id {job_id} -Force -ErrorAction SilentlyContinue")
-                except:
-                    pass
-        
-        if hasattr(self, '_active_futures'):
-            for future in list(self._active_futures):
-                future.cancel()
-            self._active_futures.clear()
-
-        if hasattr(self, '_handle') and self._handle and hasattr(self, "_dll"):
+        # Finalizers can run on any thread, during GC or interpreter shutdown,
+        # while the Shell is mid-command or already gone - never call into it
+        # here. Only the Python-side mapping handle is released; PowerShell's
+        # cached handle is released by close().
+        handle = getattr(self, "_handle", None)
+        dll = getattr(self, "_dll", None)
+        if handle and dll is not None:
+            self._handle = None
             try:
-                self._dll.VS_DestroyChannel(self._handle)
+                dll.VS_DestroyChannel(handle)
             except Exception:
                 pass
     
@@ -715,7 +899,10 @@ class ZeroCopyBridge:
         return self
     
     def __exit__(self, *args):
-        # Clean up jobs
+        self.close()
+
+    def close(self) -> None:
+        """Stop tracked jobs and futures and release the channel on both sides."""
         for job_id in self._active_jobs:
             try:
                 self.shell.run(f"Stop-Job -Id {job_id} -ErrorAction SilentlyContinue; Remove-Job -Id {job_id} -Force -ErrorAction SilentlyContinue")
@@ -723,24 +910,42 @@ class ZeroCopyBridge:
                 pass
         self._active_jobs.clear()
 
-        for future in self._active_futures:
+        for future in list(self._active_futures):
             future.cancel()
         self._active_futures.clear()
         
         if self._handle:
+            self._close_powershell_channel()
             self._dll.VS_DestroyChannel(self._handle)
             self._handle = None
 
-    def _track_future(self, future: Future[Any]) -> Future[Any]:
-        self._active_futures.append(future)
+    def _close_powershell_channel(self) -> None:
+        """Release the channel handle cached by the PowerShell side (best effort)."""
+        try:
+            if self.shell.is_running:
+                self.shell.run(
+                    f"Close-VSChannel -ChannelName '{self.channel_name_short}' -Scope '{self._scope}'",
+                    raise_on_error=False,
+                )
+        except Exception:
+            pass
 
-        def _remove(_fut: Future[Any]) -> None:
-            try:
-                self._active_futures.remove(_fut)
-            except ValueError:
-                pass
+    def prefault(self) -> None:
+        """Fault in every page of the shared frame.
+        
+        A fresh mapping is backed lazily, so the first transfer through it pays
+        one page fault per page it touches. Reading one byte per page here moves
+        that cost out of the first receive()/send(). Reads only, so it is safe
+        to call at any time.
+        """
+        stride = -(-self.frame_bytes // _VS_REGION_ALIGN) * _VS_REGION_ALIGN
+        size = _VS_REGION_ALIGN + 2 * stride
+        region = (ctypes.c_ubyte * size).from_address(self._mem_base_addr)
+        memoryview(region)[::mmap.PAGESIZE].tobytes()
 
-        future.add_done_callback(_remove)
+    def _track_future(self, future: Future[Any]) -> Future[Any]:
+        self._active_futures.add(future)
+        future.add_done_callback(self._active_futures.discard)
         return future
     
     def serialize(
@@ -782,15 +987,15 @@ class ZeroCopyBridge:
         var_name = variable.lstrip('$')
         out_name = out_var.lstrip('$') if out_var is not None else var_name
         
-        cmd = [
-            f"$xml_ = [System.Management.Automation.PSSerializer]::Serialize(${var_name}, {depth})",
-            f"${out_name} = [System.Text.Encoding]::UTF8.GetBytes($xml_)",
-        ]
+        # One statement, one round-trip; no intermediate $xml_ left in the session
+        cmd = (
+            f"${out_name} = [System.Text.Encoding]::UTF8.GetBytes("
+            f"[System.Management.Automation.PSSerializer]::Serialize(${var_name}, {depth}))"
+        )
 
-        reses = self.shell.run(cmd, timeout=timeout)
-        for res in reses:
-            if res.exit_code != 0 and not res.err:
-                return False
+        res = self.shell.run(cmd, timeout=timeout)
+        if res.exit_code != 0 and not res.err:
+            return False
         return True
     
     def deserialize(
@@ -817,15 +1022,14 @@ class ZeroCopyBridge:
         var_name = variable.lstrip('$')
         out_name = out_var.lstrip('$') if out_var is not None else var_name
         
-        cmd = [
-            f"$xml_ = [System.Text.Encoding]::UTF8.GetString(${var_name})",
-            f"${out_name} = [System.Management.Automation.PSSerializer]::Deserialize($xml_)"
-        ]
+        cmd = (
+            f"${out_name} = [System.Management.Automation.PSSerializer]::Deserialize("
+            f"[System.Text.Encoding]::UTF8.GetString(${var_name}))"
+        )
 
-        reses = self.shell.run(cmd, timeout=timeout)
-        for res in reses:
-            if res.exit_code != 0 or res.err:
-                return False
+        res = self.shell.run(cmd, timeout=timeout)
+        if res.exit_code != 0 or res.err:
+            return False
         return True
     # =========================================================================
     # POWERSHELL → PYTHON
@@ -858,91 +1062,204 @@ class ZeroCopyBridge:
         var_name = variable.lstrip('$')
         
         # Start async PowerShell send operation
-        cmd = f"""
-            Send-VariableToPython -ChannelName '{self.channel_name_short}' -Variable ${var_name} -ChunkSizeMB {self.default_chunk_bytes // (1024*1024)} -TimeoutSeconds {int(timeout)} -Scope '{self._scope}'
-        """
-        future = self.shell.run_async(cmd.strip(), timeout=timeout)
+        cmd = f"{self._send_cmd_prefix}{var_name} -TimeoutSeconds {int(timeout)}"
+        future = self.shell.run_async(cmd, timeout=timeout)
         
         # Receive data in Python (this blocks until transfer completes)
-        bytes_data = self._receive_from_powershell(timeout=timeout, return_memoryview=True)
+        data = self._receive_from_powershell(timeout=timeout, return_memoryview=return_memoryview)
         
         # Wait for PowerShell command to finish
         result = future.result()
         if result.err:
             raise RuntimeError(f"PowerShell send failed: {result.err}")
         
-        return bytes_data if return_memoryview else bytes(bytes_data)
+        return data
     
+    def receive_into(
+        self,
+        variable: str,
+        buffer: bytearray | memoryview,
+        *,
+        timeout: float = 30.0,
+    ) -> int:
+        """Send variable from PowerShell into a caller-owned buffer.
+        
+        Same transfer as receive(), but chunks are copied straight into `buffer`.
+        Reusing one buffer across receives avoids allocating (and zero-filling)
+        a new one per transfer.
+        
+        Args:
+            variable: PowerShell variable to send (e.g., "$mydata" or "mydata")
+            buffer: Writable bytes-like object large enough for the data
+            timeout: Timeout in seconds
+        
+        Returns:
+            Number of bytes written to the start of `buffer`
+        
+        Raises:
+            ValueError: If `buffer` is not C-contiguous or is smaller than the data sent
+        
+        Example:
+            >>> buf = bytearray(16 * 1024 * 1024)
+            >>> n = bridge.receive_into("mydata", buf)
+            >>> obj = PSObject.from_bytes(memoryview(buf)[:n])
+        """
+        try:
+            view = memoryview(buffer)
+        except TypeError:
+            raise TypeError("buffer must be a writable bytes-like object") from None
+        if view.readonly:
+            raise TypeError("buffer must be a writable bytes-like object")
+        # Checked before PowerShell starts sending: a strided view would only
+        # fail at from_buffer() and leave the PowerShell side blocked
+        if not view.c_contiguous:
+            raise ValueError("buffer must be C-contiguous")
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+        
+        var_name = variable.lstrip('$')
+        cmd = f"{self._send_cmd_prefix}{var_name} -TimeoutSeconds {int(timeout)}"
+        future = self.shell.run_async(cmd, timeout=timeout)
+        
+        data = self._receive_from_powershell(timeout=timeout, into=view)
+        
+        result = future.result()
+        if result.err:
+            raise RuntimeError(f"PowerShell send failed: {result.err}")
+        
+        return data.nbytes
+    
+    def allocate_receive_buffer(self, size: int, *, large_pages: bool = False) -> memoryview:
+        """Allocate a page-aligned buffer for receive_into().
+        
+        The buffer is anonymous mmap memory, whose pages the OS zero-fills lazily
+        instead of up front like a bytearray. With large_pages=True it is
+        VirtualAlloc'd with MEM_LARGE_PAGES. That needs SeLockMemoryPrivilege
+        granted to the account; the DLL enables it in the process token. Falls
+        back to regular pages otherwise (the view's .obj is then an mmap.mmap).
+        Large pages cut TLB misses while copying big payloads but are locked in
+        RAM for the buffer's lifetime.
+        
+        Args:
+            size: Buffer size in bytes
+            large_pages: Try to back the buffer with large pages
+        
+        Returns:
+            Writable byte memoryview of exactly `size` bytes
+        
+        Example:
+            >>> buf = bridge.allocate_receive_buffer(100 * 1024 * 1024, large_pages=True)
+            >>> n = bridge.receive_into("mydata", buf)
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if large_pages:
+            buf = _alloc_large_pages(size)
+            if buf is not None:
+                return memoryview(buf)[:size]
+        return memoryview(mmap.mmap(-1, size))
+
     def _receive_from_powershell(
         self,
         *,
         timeout: float = 30.0,
-        return_memoryview: bool = False
+        return_memoryview: bool = False,
+        into: Optional[memoryview] = None,
     ) -> bytes | memoryview:
         """Receive data from PowerShell (zero-copy).
         
         Args:
             timeout: Timeout in seconds
             return_memoryview: If True, return memoryview (zero-copy)
+            into: Byte-format memoryview to copy into instead of a new buffer
         
         Returns:
-            bytes or memoryview of received data
+            bytes or memoryview of received data (a slice of `into` if given)
         """
         dll = self._dll
         timeout_ms = int(timeout * 1000)
-        chunks = []
+        chunks: List[bytes] = []
+        out: Optional[bytearray | memoryview | mmap.mmap] = None
+        out_addr = 0
+        received = 0
+        num_chunks = 0
+        too_small = False
+        
+        # One out-param struct, overwritten by every successful wait
+        info = _VSChunkInfo()
+        info_ref = ctypes.byref(info)
+        
+        # Per-chunk callables and constants bound to locals once per transfer
+        handle = self._handle
+        mem_base = self._mem_base_addr
+        ack_wait = dll.VS_AckWaitPs2PyChunkInfo
+        memmove = ctypes.memmove
+        string_at = ctypes.string_at
+        
+        wait_call = "VS_WaitPs2PyChunkInfo"
+        result = dll.VS_WaitPs2PyChunkInfo(handle, info_ref, timeout_ms)
         
         while True:
-            chunk_index = ctypes.c_uint32()
-            chunk_offset = ctypes.c_uint64()
-            chunk_length = ctypes.c_uint64()
-            
-            result = dll.VS_WaitPs2PyChunk(
-                self._handle,
-                ctypes.byref(chunk_index),
-                ctypes.byref(chunk_offset),
-                ctypes.byref(chunk_length),
-                timeout_ms
-            )
-            
             if result == VS_TIMEOUT:
                 # PowerShell might have finished immediately after the last ACK
-                if dll.VS_IsPs2PyComplete(self._handle):
+                if dll.VS_IsPs2PyComplete(handle):
                     break
                 raise TimeoutError("Timeout waiting for PowerShell chunk")
             elif result != VS_OK:
-                raise RuntimeError(f"VS_WaitPs2PyChunk failed: {result}")
+                raise RuntimeError(f"{wait_call} failed: {result}")
             
-            # Zero-copy read from shared memory
-            ptr = ctypes.c_void_p(self._mem_base_addr + chunk_offset.value)
-            c_array = ctypes.cast(ptr, ctypes.POINTER(ctypes.c_ubyte * chunk_length.value)).contents
-            chunk_mv = memoryview(c_array)
-            
-            chunks.append(bytes(chunk_mv))
-            
-            # Acknowledge chunk
-            result = dll.VS_AckPs2PyChunk(self._handle)
-            if result != VS_OK:
-                raise RuntimeError(f"VS_AckPs2PyChunk failed: {result}")
+            # Copy the chunk out of shared memory before the region is reused
+            length = info.length
+            src = mem_base + info.offset
+            if not num_chunks:
+                # The plan is fixed for the whole transfer - read it once
+                total_size, _, num_chunks = _VS_PS2PY_PLAN.unpack_from(self._ps2py_plan)
+            if return_memoryview or into is not None:
+                # Single copy straight into a buffer sized from the header
+                if out is None:
+                    if into is not None:
+                        out = into
+                    elif total_size >= _MMAP_RECEIVE_BYTES:
+                        out = mmap.mmap(-1, total_size)
+                    else:
+                        out = bytearray(total_size)
+                    too_small = total_size > len(out)
+                    if out and not too_small:
+                        out_addr = ctypes.addressof(ctypes.c_char.from_buffer(out))
+                if too_small:
+                    pass  # Keep acking so PowerShell finishes; raised below
+                elif received + length > len(out):
+                    raise RuntimeError("PowerShell sent more data than announced")
+                else:
+                    memmove(out_addr + received, src, length)
+                    received += length
+            else:
+                chunks.append(string_at(src, length))
             
-            # Check if complete
-            is_complete = dll.VS_IsPs2PyComplete(self._handle)
-            if not is_complete:
-                poll_deadline = time.perf_counter() + min(0.2, timeout)
-                while time.perf_counter() < poll_deadline:
-                    if dll.VS_IsPs2PyComplete(self._handle):
-                        is_complete = 1
-                        break
-                    time.sleep(0.001)
-            if is_complete:
+            # The chunk count is published by VS_BeginPs2PyTransfer before the
+            # first chunk is signalled, so the last chunk ends the transfer without
+            # waiting for PowerShell to set transfer_done.
+            if info.chunk_index + 1 >= num_chunks:
+                result = dll.VS_AckPs2PyChunk(handle)
+                if result != VS_OK:
+                    raise RuntimeError(f"VS_AckPs2PyChunk failed: {result}")
                 break
+            
+            # Acknowledge this chunk and wait for the next in one DLL call
+            wait_call = "VS_AckWaitPs2PyChunkInfo"
+            result = ack_wait(handle, info_ref, timeout_ms)
         
+        if too_small:
+            raise ValueError(
+                f"Buffer too small: {total_size} bytes received, {len(out)} available"
+            )
+        if into is not None:
+            return into[:received]
+        if return_memoryview:
+            return memoryview(out if out is not None else bytearray())
         if not chunks:
-            data = b""
-        else:
-            data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
-        
-        return memoryview(data) if return_memoryview else data
+            return b""
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
     
     # =========================================================================
     # PYTHON → POWERSHELL
@@ -950,7 +1267,7 @@ class ZeroCopyBridge:
     
     def send(
         self,
-        data: bytes,
+        data: bytes | bytearray | memoryview,
         variable: str,
         *,
         chunk_size: Optional[int] = None,
@@ -962,7 +1279,7 @@ class ZeroCopyBridge:
         This is a complete transfer operation in the opposite direction of receive().
         
         Args:
-            data: Bytes to send
+            data: Bytes-like object to send (bytes, bytearray, memoryview, ...)
             variable: PowerShell variable name to store data (e.g., "myvar" or "$myvar")
             chunk_size: Chunk size in bytes (default: self.default_chunk_bytes)
             timeout: Timeout in seconds
@@ -971,49 +1288,53 @@ class ZeroCopyBridge:
             >>> bridge.send(b"Hello PowerShell", "mydata")
             >>> # Now $mydata contains the bytes in PowerShell
         """
-        if not isinstance(data, bytes):
-            raise TypeError("data must be bytes")
+        try:
+            view = memoryview(data)
+        except TypeError:
+            raise TypeError("data must be a bytes-like object") from None
+        if not view.c_contiguous:
+            raise ValueError("data must be C-contiguous")
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+        total = view.nbytes
 
         var_name = variable.lstrip('$')
-        
-        # Start async PowerShell receive operation
-        future = self._receive_to_powershell_async(var_name, timeout=timeout)
-
         chunk_bytes = chunk_size or self.default_chunk_bytes
         timeout_ms = int(timeout * 1000)
         
-        # Begin transfer
-        dll = self._dll
-        result = dll.VS_BeginPy2PsTransfer(self._handle, len(data), chunk_bytes)
-        if result != VS_OK:
-            raise RuntimeError(f"VS_BeginPy2PsTransfer failed: {result}")
-        
-        # Send chunks
-        num_chunks = (len(data) + chunk_bytes - 1) // chunk_bytes
+        # The DLL reads chunks straight from the caller's buffer, so the only
+        # copy is the one into shared memory. `src` keeps it alive.
+        src: Any = None
+        src_addr = 0
+        if total and not view.readonly:
+            src = ctypes.c_char.from_buffer(view)
+            src_addr = ctypes.addressof(src)
+        elif total:
+            # from_buffer() refuses read-only buffers, so export the pointer
+            # through the buffer protocol instead; held until the send is done
+            src = _PyBuffer()
+            ctypes.pythonapi.PyObject_GetBuffer(view, ctypes.byref(src), _PyBUF_SIMPLE)
+            src_addr = src.buf or 0
         
-        for i in range(num_chunks):
-            offset = i * chunk_bytes
-            chunk_len = min(chunk_bytes, len(data) - offset)
-            chunk_data = data[offset:offset + chunk_len]
-            
-            c_array = (ctypes.c_ubyte * len(chunk_data)).from_buffer_copy(chunk_data)
+        try:
+            # Start async PowerShell receive operation only once the source buffer
+            # is known to be usable, so a bad buffer can't leave PowerShell waiting
+            future = self._receive_to_powershell_async(var_name, timeout=timeout)
             
-            result = dll.VS_SendPy2PsChunk(
-                self._handle, i, c_array, chunk_len, timeout_ms
+            # Begin, every chunk + ACK and finish run in one DLL call
+            failed_chunk = ctypes.c_uint32()
+            result = self._dll.VS_SendPy2PsAll(
+                self._handle, src_addr or None, total, chunk_bytes, timeout_ms,
+                ctypes.byref(failed_chunk)
             )
-            if result != VS_OK:
-                raise RuntimeError(f"VS_SendPy2PsChunk failed at chunk {i}: {result}")
-            
-            result = dll.VS_WaitPy2PsAck(self._handle, timeout_ms)
-            if result == VS_TIMEOUT:
-                raise TimeoutError(f"Timeout waiting for PowerShell ACK at chunk {i}")
-            elif result != VS_OK:
-                raise RuntimeError(f"VS_WaitPy2PsAck failed at chunk {i}: {result}")
-        
-        # Mark complete
-        result = dll.VS_FinishPy2PsTransfer(self._handle)
+        finally:
+            if isinstance(src, _PyBuffer):
+                ctypes.pythonapi.PyBuffer_Release(ctypes.byref(src))
         if result != VS_OK:
-            raise RuntimeError(f"VS_FinishPy2PsTransfer failed: {result}")
+            at_chunk = "" if failed_chunk.value == VS_NO_CHUNK else f" at chunk {failed_chunk.value}"
+            if result == VS_TIMEOUT:
+                raise TimeoutError(f"Timeout sending to PowerShell{at_chunk}")
+            raise RuntimeError(f"VS_SendPy2PsAll failed{at_chunk}: {result}")
         
         # Wait for PowerShell to complete receive
         future_res = future.result(timeout=5.0)
@@ -1036,11 +1357,8 @@ class ZeroCopyBridge:
             Future representing the receive operation
         """
         # Use run_async completion future instead of spawning jobs
-        cmd = f"""
-            Receive-VariableFromPython -ChannelName '{self.channel_name_short}' -VariableName '{variable}' -TimeoutSeconds {int(timeout)} -Scope '{self._scope}'
-        """
-        command = cmd.strip()
-        future = self.shell.run_async(command, timeout=timeout)
+        cmd = f"{self._recv_cmd_prefix}{variable}' -TimeoutSeconds {int(timeout)}"
+        future = self.shell.run_async(cmd, timeout=timeout)
         return self._track_future(future)
 
     @property